@@ -0,0 +1,273 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+"""
+Measure the frame loop of pygame_gui on synthetic scenes, without any display
+
+Usage:
+    python software/benchmarks/frame_loop.py --scenes labels buttons --counts 10 100 1000
+    python software/benchmarks/frame_loop.py --save software/benchmarks/baselines/main.json
+    python software/benchmarks/frame_loop.py --compare software/benchmarks/baselines/main.json
+
+Each (scene, count) case runs in a fresh interpreter, so the startup time and
+the peak memory of a case don't depend on the previous ones
+With --compare, the script exits with the code 1 when a case is slower than
+the baseline by more than --tolerance
+"""
+
+# Imports
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+SOFTWARE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_FOLDER = os.path.join(SOFTWARE_FOLDER, "images")
+
+SCENES = [
+    "labels",
+    "buttons",
+    "button_images",
+    "text_inputs",
+    "shapes",
+    "mixed",
+    "modal",
+]
+
+
+def build_scene(pgui, window, scene: str, count: int):
+    """
+    build_scene(pgui, window, scene:str, count:int)
+    Add `count` widgets of the scene to the window, on a grid covering it
+    The modal scene is the labels under an opaque Label covering the window
+    """
+    width, height = window._size
+    columns = max(1, width // 60)
+    if scene == "modal":
+        build_scene(pgui, window, "labels", count)
+        window.add(
+            "modal",
+            pgui.Label(
+                position=(0, 0),
+                size=(width, height),
+                text="modal",
+                bg="#000040",
+                fg="#FFFFFF",
+                text_size=20,
+            ),
+            layer=1,
+        )
+        return
+    kinds = SCENES[: SCENES.index("mixed")] if scene == "mixed" else [scene]
+    for index in range(count):
+        x = (index % columns) * 60
+        y = (index // columns) * 40 % max(1, height - 40)
+        kind = kinds[index % len(kinds)]
+        if kind == "labels":
+            widget = pgui.Label(
+                position=(x, y),
+                size=(56, 36),
+                text=str(index),
+                bg="#202020",
+                fg="#FFFFFF",
+                text_size=20,
+            )
+        elif kind == "buttons":
+            widget = pgui.Button(
+                position=(x, y),
+                size=(56, 36),
+                text=str(index),
+                bg="#0000FF",
+                fg="#FFFFFF",
+                onclick=lambda: None,
+                text_size=20,
+            )
+        elif kind == "button_images":
+            widget = pgui.ButtonImage(
+                position=(x, y),
+                text=str(index),
+                fg="#FFFFFF",
+                onclick=lambda: None,
+                text_size=12,
+                path=os.path.join(IMAGES_FOLDER, "close.png"),
+            )
+        elif kind == "text_inputs":
+            widget = pgui.TextInput(
+                position=(x, y),
+                size=(56, 36),
+                bg="#673829",
+                fg="#000000",
+                text_size=20,
+            )
+        elif index % 2:
+            widget = pgui.Line(
+                start=(x, y), end=(x + 50, y + 30), color="#FF0000", width=2
+            )
+        else:
+            widget = pgui.Polygon(
+                points=[(x, y), (x + 50, y), (x + 25, y + 30)], color="#00FF00"
+            )
+        window[f"{kind}_{index}"] = widget
+
+
+def synthetic_events(pygame, frame: int, size: tuple) -> tuple:
+    """
+    synthetic_events(pygame, frame:int, size:tuple)->tuple
+    Return the (events, pointer) of a frame: the pointer moves on every frame,
+    clicks every 10 frames and a key is typed every 30 frames
+    """
+    pointer = ((frame * 37) % size[0], (frame * 23) % size[1])
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=pointer, rel=(1, 1), buttons=(0, 0, 0))]
+    if frame % 10 == 0:
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pointer, button=1))
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pointer, button=1))
+    if frame % 30 == 0:
+        events.append(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a", mod=0, scancode=4)
+        )
+        events.append(
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_a, unicode="a", mod=0, scancode=4)
+        )
+    return events, pointer
+
+
+def run_case(scene: str, count: int, frames: int, dirty: bool) -> dict:
+    """
+    run_case(scene:str, count:int, frames:int, dirty:bool)->dict
+    Build the scene in this interpreter and drive the frames
+    """
+    start = time.perf_counter()
+    sys.path.insert(0, SOFTWARE_FOLDER)
+    import pygame
+    import pygame_gui as pgui
+
+    imported = time.perf_counter()
+    window = pgui.Window("#000000", dirty=dirty)
+    build_scene(pgui, window, scene, count)
+    built = time.perf_counter()
+    latencies = list()
+    for frame in range(frames):
+        events, pointer = synthetic_events(pygame, frame, window._size)
+        frame_start = time.perf_counter()
+        window.frame(events=events, pointer=pointer)
+        latencies.append(time.perf_counter() - frame_start)
+    total = sum(latencies)
+    latencies.sort()
+
+    def percentile(percent):
+        return latencies[min(len(latencies) - 1, int(percent / 100 * len(latencies)))]
+
+    import resource
+
+    # ! ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return {
+        "scene": scene,
+        "count": count,
+        "frames": frames,
+        "dirty": dirty,
+        "fps": frames / total if total else 0.0,
+        "p50_ms": percentile(50) * 1000,
+        "p95_ms": percentile(95) * 1000,
+        "p99_ms": percentile(99) * 1000,
+        "import_s": imported - start,
+        "startup_s": built - start,
+        "peak_rss_kb": peak,
+        "culled": window.culled,
+    }
+
+
+def spawn_case(scene: str, count: int, frames: int, dirty: bool) -> dict:
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--child",
+        scene,
+        str(count),
+        "--frames",
+        str(frames),
+    ]
+    if dirty:
+        command.append("--dirty")
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{scene} x{count} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(results: list, baseline: list, tolerance: float) -> bool:
+    """
+    compare(results:list, baseline:list, tolerance:float)->bool
+    Print the ratio of each case to the baseline, return False on a regression
+    """
+    known = {(case["scene"], case["count"], case["dirty"]): case for case in baseline}
+    ok = True
+    for case in results:
+        old = known.get((case["scene"], case["count"], case["dirty"]))
+        if old is None:
+            continue
+        ratio = case["p95_ms"] / old["p95_ms"] if old["p95_ms"] else 1.0
+        slower = ratio > 1 + tolerance
+        ok = ok and not slower
+        print(
+            f"{case['scene']:>14} x{case['count']:<6} p95 {old['p95_ms']:8.2f} -> "
+            f"{case['p95_ms']:8.2f} ms ({ratio:.2f}x){'  ! regression' if slower else ''}"
+        )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scenes", nargs="+", default=SCENES, choices=SCENES)
+    parser.add_argument("--counts", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--dirty", action="store_true", help="use the dirty rectangles")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument("--child", nargs=2, metavar=("SCENE", "COUNT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        scene, count = args.child
+        print(json.dumps(run_case(scene, int(count), args.frames, args.dirty)))
+        return
+
+    results = list()
+    for scene in args.scenes:
+        for count in args.counts:
+            case = spawn_case(scene, count, args.frames, args.dirty)
+            results.append(case)
+            print(
+                f"{scene:>14} x{count:<6} {case['fps']:9.1f} fps  "
+                f"p50 {case['p50_ms']:7.2f}  p95 {case['p95_ms']:7.2f}  p99 {case['p99_ms']:7.2f} ms  "
+                f"startup {case['startup_s'] * 1000:7.1f} ms  rss {case['peak_rss_kb'] / 1024:6.1f} MB  "
+                f"culled {case['culled']}"
+            )
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+"""
+Measure the time needed to import pygame_gui in a fresh interpreter
+
+Usage: python software/benchmarks/import_time.py [--runs 5] [--budget 0.4]
+The script exits with the code 1 when the median import time is over the budget
+"""
+
+# Imports
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SOFTWARE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# * The import must not need a display nor a sound card
+SNIPPET = """
+import time
+start = time.perf_counter()
+import pygame_gui
+print(time.perf_counter() - start)
+"""
+
+
+def measure(runs: int) -> list:
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    times = list()
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", SNIPPET],
+            cwd=SOFTWARE_FOLDER,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=0.4, help="max median import time, in seconds"
+    )
+    args = parser.parse_args()
+    times = measure(args.runs)
+    median = statistics.median(times)
+    print(
+        f"import pygame_gui: median {median * 1000:.1f} ms, "
+        f"min {min(times) * 1000:.1f} ms, max {max(times) * 1000:.1f} ms "
+        f"(budget {args.budget * 1000:.0f} ms)"
+    )
+    if median > args.budget:
+        print("! over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
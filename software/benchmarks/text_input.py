@@ -0,0 +1,98 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+"""
+Measure the cost of typing into a TextInput and a wrapped Label, one character
+at a time, and check the typed text looks the same as a Label built with it
+
+Usage: python software/benchmarks/text_input.py [--text "Typing: AVATAR WAVE To Yo"] [--repeat 4]
+The script exits with the code 1 when the pixels of the typed text differ
+"""
+
+# Imports
+import argparse
+import os
+import sys
+import time
+
+SOFTWARE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def surface_diff(first, second) -> int:
+    """
+    surface_diff(first:pygame.Surface, second:pygame.Surface)->int
+    The number of pixels differing between two surfaces of the same size
+    """
+    width, height = first.get_size()
+    return sum(
+        first.get_at((x, y)) != second.get_at((x, y)) for x in range(width) for y in range(height)
+    )
+
+
+def type_text(text: str, update) -> list:
+    """
+    type_text(text:str, update)->list
+    Call update with the text one more character at a time, return the time of each keystroke
+    """
+    times = list()
+    for end in range(1, len(text) + 1):
+        start = time.perf_counter()
+        update(text[:end])
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--text", default="Typing: AVATAR WAVE To Yo")
+    parser.add_argument("--repeat", type=int, default=4, help="how many times the text is typed")
+    args = parser.parse_args()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    sys.path.insert(0, SOFTWARE_FOLDER)
+    import pygame_gui as pgui
+
+    # * The texts are rendered in the display format, as in a real Window
+    pgui.Window("#000000")
+    text = " ".join([args.text] * args.repeat)
+    failed = False
+
+    typed = pgui.TextInput(
+        position=(0, 0), size=(160, 40), bg="#FFFFFF", fg="#000000", text_size=20
+    )
+    times = type_text(text, typed.__update_text__)
+    direct = pgui.TextInput(
+        position=(0, 0), size=(160, 40), bg="#FFFFFF", fg="#000000", text_size=20
+    )
+    direct.__update_text__(text)
+    diff = surface_diff(typed._text_area._surf, direct._text_area._surf)
+    print(
+        f"TextInput x{len(text)}: last keystroke {times[-1] * 1000:.3f} ms, "
+        f"total {sum(times) * 1000:.1f} ms, {diff} pixels differ"
+    )
+    failed |= diff > 0
+
+    options = dict(
+        position=(0, 0), size=(160, 200), bg="#FFFFFF", fg="#000000", text_size=20, wrap=True
+    )
+    label = pgui.Label(text="", **options)
+    times = type_text(text, lambda value: label.configure(text_value=value))
+    diff = surface_diff(label._surf, pgui.Label(text=text, **options)._surf)
+    print(
+        f"wrapped Label x{len(text)}: last keystroke {times[-1] * 1000:.3f} ms, "
+        f"total {sum(times) * 1000:.1f} ms, {diff} pixels differ"
+    )
+    failed |= diff > 0
+
+    if failed:
+        print("! the typed text differs from the same text set at once")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
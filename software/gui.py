@@ -12,12 +12,9 @@ SOUNDS_FOLDER = os.path.join(os.getcwd(), "software", "sounds")
 IMAGES_FOLDER = os.path.join(os.getcwd(), "software", "images")
 
 # * code des fonctions
-def second():
-    main["label_hour"].configure(text_value=str(int(main.duration)))
 def foo():
     main.play_sound("click.tick")
     print("foo")
-    second()
 # Initialiser la fenêtre
 main = pgui.Window("#000000")
 # charger les musiques
@@ -58,7 +55,8 @@ main["button"] = pgui.Button(
     size=(200, 100),
 
 )
-main.tick.add(second)
+# * The Label is only configured when the number of seconds changes
+main.bind("label_hour", lambda: int(main.duration), max_rate=4)
 main.run()
 pygame.quit()
 sys.exit()
\ No newline at end of file
@@ -1,23 +1,46 @@
-import subprocess
 AUTHORS = ["Donatien Vachette"]
 NAME = "pygame-gui"
 required = [
     "pygame",
     "pygame-vkeyboard",
 ]
-__installed_modules = subprocess.run("pip freeze", shell=True, capture_output=True).stdout.decode('utf-8').lower()
-for mod in required:
-    if mod not in __installed_modules:
-        print(mod,"is not installed")
-        subprocess.run("pip install {}".format(mod),shell = True)
+# The other distributions providing the same module
+alternatives = {
+    "pygame": ["pygame-ce"],
+}
+# Only needed by some widgets, imported on first use
+optional = [
+    "numpy",  # Canvas
+]
+
+
+def check_dependencies(install: bool = False) -> list:
+    """
+    check_dependencies(install:bool=False)->list
+    Return the required modules that are not installed,
+    and install them with pip if `install` is True
+    """
+    from importlib import metadata
+    import subprocess
+    import sys
+
+    missing = list()
+    for mod in required:
+        for name in [mod, *alternatives.get(mod, ())]:
+            try:
+                metadata.version(name)
+                break
+            except metadata.PackageNotFoundError:
+                pass
+        else:
+            print(mod, "is not installed")
+            missing.append(mod)
+    if install and missing:
+        subprocess.run([sys.executable, "-m", "pip", "install", *missing])
+    return missing
+
 
-del __installed_modules
 from .main import *
-import pygame_vkeyboard
-import pygame
 
 
-if not pygame.get_init():
-    pygame.init()
-    pygame.mixer.init()
-print(f'Module {NAME} by {", ".join(AUTHORS)}.')
\ No newline at end of file
+print(f'Module {NAME} by {", ".join(AUTHORS)}.')
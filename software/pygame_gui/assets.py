@@ -0,0 +1,134 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import pygame
+
+
+# Posted when an asset is decoded, so a waiting Window wakes up to apply it
+ASSET_LOADED = pygame.event.custom_type()
+
+
+def placeholder(size: tuple | None = None) -> pygame.surface.Surface:
+    """
+    placeholder(size:tuple=None)->pygame.Surface
+    Return a transparent surface, displayed while the real image is loading
+    """
+    if size is None:
+        size = (1, 1)
+    return pygame.Surface(size, pygame.SRCALPHA)
+
+
+class AssetLoader:
+    """
+    This class decodes the images and sounds in a pool of threads
+
+    The callbacks are never called by the threads: the results are
+    applied on the UI thread by AssetLoader.poll(), called by the Window
+    on every frame
+
+    :workers: int
+    The number of threads used to decode the files
+    """
+
+    def __init__(self, workers: int = 4):
+        self._workers = workers
+        self._executor = None
+        self._done = queue.SimpleQueue()
+        self.total = 0
+        self.loaded = 0
+        self.failed = 0
+
+    def __repr__(self):
+        return f"""AssetLoader object ({self.loaded + self.failed}/{self.total} assets)"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def pending(self) -> int:
+        """The number of assets submitted and not applied yet"""
+        return self.total - self.loaded - self.failed
+
+    @property
+    def progress(self) -> float:
+        """The part of the submitted assets already applied, between 0 and 1"""
+        if self.total == 0:
+            return 1.0
+        return (self.loaded + self.failed) / self.total
+
+    def __submit__(self, decode, path, callback):
+        if self._executor is None:
+            # * The threads are only started by the first asset
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="pygame_gui-assets"
+            )
+        self.total += 1
+
+        def work():
+            try:
+                result, error = decode(path), None
+            except Exception as exception:
+                result, error = None, exception
+            self._done.put((callback, result, error))
+            try:
+                pygame.event.post(pygame.event.Event(ASSET_LOADED, path=path))
+            except pygame.error:
+                # ! The display may not be initialized yet, poll() still applies it
+                pass
+
+        self._executor.submit(work)
+
+    def load_image(self, path, callback, size: tuple | None = None):
+        """
+        AssetLoader.load_image(path, callback, size:tuple=None)->pygame.Surface
+
+        Decode the image in the background, and return a placeholder of the
+        given size to display meanwhile
+        callback(surface) is called by poll() once the image is decoded
+        """
+        self.__submit__(pygame.image.load, path, callback)
+        return placeholder(size)
+
+    def load_sound(self, path, callback):
+        """
+        AssetLoader.load_sound(path, callback)
+
+        Decode the sound in the background
+        callback(sound) is called by poll() once the sound is decoded
+        """
+        self.__submit__(pygame.mixer.Sound, path, callback)
+
+    def poll(self, limit: int | None = None) -> int:
+        """
+        AssetLoader.poll(limit:int=None)->int
+
+        Apply the decoded assets on the calling thread, return how many were applied
+        A failed asset keeps its placeholder and its error is printed
+        """
+        applied = 0
+        while limit is None or applied < limit:
+            try:
+                callback, result, error = self._done.get_nowait()
+            except queue.Empty:
+                break
+            applied += 1
+            if error is not None:
+                self.failed += 1
+                print("Unable to load an asset:", error)
+                continue
+            self.loaded += 1
+            callback(result)
+        return applied
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,154 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+from collections import deque
+import os
+import time
+import pygame
+from .cache import LRUCache
+
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """
+    sound_bytes(sound:pygame.mixer.Sound)->int
+    Return the amount of memory used by a decoded sound
+    """
+    init = pygame.mixer.get_init()
+    if init is None:
+        return 0
+    frequency, size, channels = init
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+
+class AudioLibrary:
+    """
+    This class keeps the sounds and musics of a Window by name, the files
+    are only read when they are played
+
+    The musics are streamed with pygame.mixer.music, the sounds are decoded
+    on their first play and kept in a memory bounded cache
+
+    :max_bytes: int
+    The memory budget of the decoded sounds, in bytes
+    """
+
+    def __init__(self, *, max_bytes: int = 32 * 1024 * 1024):
+        self._sounds = dict()
+        self._musics = dict()
+        self._decoded = LRUCache(max_bytes=max_bytes, sizeof=sound_bytes)
+        self._music = None
+        # The last decoding times, in seconds
+        self._latencies = deque(maxlen=100)
+        self.decodes = 0
+
+    def __repr__(self):
+        return f"""AudioLibrary object ({len(self._sounds)} sounds, {len(self._musics)} musics)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def add_sound(self, name, path):
+        self._sounds[name] = path
+
+    def add_music(self, name, path):
+        self._musics[name] = path
+
+    def load_folder(self, path, music: bool = False):
+        """
+        AudioLibrary.load_folder(path, music:bool=False)
+        Register all the .mp3 files of a folder, named after the file
+        """
+        for file in os.listdir(path):
+            if file.endswith(".mp3"):
+                name = file.split(".mp3")[0]
+                if music:
+                    self.add_music(name, os.path.join(path, file))
+                else:
+                    self.add_sound(name, os.path.join(path, file))
+
+    def sound(self, name) -> pygame.mixer.Sound:
+        """
+        AudioLibrary.sound(name)->pygame.mixer.Sound
+        Return the decoded sound, decoding it if it is not in the cache
+        """
+        sound = self._decoded.get(name)
+        if sound is None:
+            start = time.perf_counter()
+            sound = pygame.mixer.Sound(self._sounds[name])
+            self._latencies.append(time.perf_counter() - start)
+            self.decodes += 1
+            self._decoded.put(name, sound)
+        return sound
+
+    def preload(self, *names):
+        """
+        AudioLibrary.preload(*names)
+        Decode the given sounds before they are played
+        """
+        for name in names:
+            self.sound(name)
+
+    def preload_async(self, name, loader):
+        """
+        AudioLibrary.preload_async(name, loader)
+        Decode the sound in the background with the given AssetLoader
+        """
+        if name in self._decoded:
+            return
+
+        def loaded(sound):
+            self.decodes += 1
+            self._decoded.put(name, sound)
+
+        loader.load_sound(self._sounds[name], loaded)
+
+    def play_sound(self, name):
+        self.sound(name).play()
+
+    def stop_sound(self, name):
+        # * A sound which is not decoded can not be playing
+        sound = self._decoded.get(name)
+        if sound is not None:
+            sound.stop()
+
+    def play_music(self, name, count=0):
+        if self._music != name:
+            pygame.mixer.music.load(self._musics[name])
+            self._music = name
+        pygame.mixer.music.play(count)
+
+    def pause_music(self, name=None):
+        if name is None or name == self._music:
+            pygame.mixer.music.pause()
+
+    def unpause_music(self, name=None):
+        if name is None or name == self._music:
+            pygame.mixer.music.unpause()
+
+    def stop_music(self, name=None):
+        if name is None or name == self._music:
+            pygame.mixer.music.stop()
+
+    def silence(self):
+        pygame.mixer.stop()
+        pygame.mixer.music.stop()
+
+    def stats(self) -> dict:
+        latencies = list(self._latencies)
+        return {
+            "sounds": len(self._sounds),
+            "musics": len(self._musics),
+            "decoded": len(self._decoded),
+            "decoded_bytes": self._decoded.bytes,
+            "max_bytes": self._decoded.max_bytes,
+            "decodes": self.decodes,
+            "evictions": self._decoded.evictions,
+            "load_latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+            "load_latency_max": max(latencies, default=0.0),
+        }
@@ -0,0 +1,166 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+class Observable:
+    """
+    A value telling its subscribers when it changes
+
+    :value:
+    The first value
+    """
+
+    def __init__(self, value=None):
+        self._value = value
+        self._subscribers = list()
+
+    def __repr__(self):
+        return f"""Observable object ({self._value!r}, {len(self._subscribers)} subscribers)"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self.set(value)
+
+    def set(self, value):
+        """
+        Observable.set(value)
+        Change the value, the subscribers are only called if it is different
+        """
+        if value == self._value:
+            return
+        self._value = value
+        for callback in list(self._subscribers):
+            callback(value)
+
+    def subscribe(self, callback):
+        """
+        Observable.subscribe(callback)
+        Call callback(value) on every change
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+
+class Binding:
+    """
+    This class keeps a property of a widget up to date with a value
+
+    The widget is only configured when the formatted value changes, and at
+    most `max_rate` times per second: the last value is applied once the delay
+    is over
+
+    :source: Observable | function
+    The value to display, a function is called `max_rate` times per second
+
+    :target:
+    The function called with the formatted value, like
+    lambda text: label.configure(text_value=text)
+
+    :format:
+    The function turning the value into what is displayed, str by default
+
+    :max_rate: float
+    The maximum number of updates per second, None for no limit
+
+    :scheduler: Scheduler
+    The timers used to delay the updates and to call a function source
+    """
+
+    def __init__(self, source, target, format=str, max_rate: float | None = None, scheduler=None):
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if (max_rate is not None or not isinstance(source, Observable)) and scheduler is None:
+            raise ValueError("A Scheduler is needed to limit the rate or to call a function")
+        if not isinstance(source, Observable) and max_rate is None:
+            raise ValueError("A function source needs a max_rate")
+        self._source = source
+        self._target = target
+        self._format = format
+        self._period = None if max_rate is None else 1 / max_rate
+        self._scheduler = scheduler
+        self._shown = None
+        self._waiting = None
+        self._last = None
+        self._delayed = None
+        self._poller = None
+        self.updates = 0
+        self.skipped = 0
+        if isinstance(source, Observable):
+            source.subscribe(self.__changed__)
+            self.__changed__(source.value)
+        else:
+            # * The function is only called at the limited rate, never on every frame
+            self._poller = scheduler.schedule(self.__poll__, self._period, repeat=True)
+            self.__poll__()
+
+    def __repr__(self):
+        return f"""Binding object ({self._shown!r}, {self.updates} updates)"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def active(self) -> bool:
+        return self._source is not None
+
+    def __poll__(self):
+        self.__changed__(self._source.__call__())
+
+    def __changed__(self, value):
+        shown = self._format(value)
+        if shown == self._shown:
+            self._waiting = None
+            self.skipped += 1
+            return
+        if self._period is None or self._last is None:
+            self.__apply__(shown)
+            return
+        wait = self._last + self._period - self._scheduler.now()
+        if wait <= 0:
+            self.__apply__(shown)
+            return
+        # * Only the last value is applied once the delay is over
+        self._waiting = shown
+        if self._delayed is None:
+            self._delayed = self._scheduler.schedule(self.__flush__, wait)
+
+    def __flush__(self):
+        self._delayed = None
+        if self._waiting is not None:
+            self.__apply__(self._waiting)
+
+    def __apply__(self, shown):
+        self._waiting = None
+        self._shown = shown
+        if self._period is not None:
+            self._last = self._scheduler.now()
+        self.updates += 1
+        self._target.__call__(shown)
+
+    def unbind(self):
+        """
+        Binding.unbind()
+        Stop updating the widget
+        """
+        if isinstance(self._source, Observable):
+            self._source.unsubscribe(self.__changed__)
+        for timer in (self._poller, self._delayed):
+            if timer is not None:
+                timer.cancel()
+        self._poller = self._delayed = None
+        self._source = None
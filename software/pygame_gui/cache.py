@@ -0,0 +1,127 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+from collections import OrderedDict
+import pygame
+
+
+def surface_bytes(surface: pygame.surface.Surface) -> int:
+    """
+    surface_bytes(surface:pygame.Surface)->int
+    Return the amount of memory used by the pixels of a surface
+    """
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def image_bytes(entry: tuple) -> int:
+    """
+    image_bytes(entry:tuple)->int
+    Return the amount of memory used by a (surface, mask) pair
+    """
+    surface, mask = entry
+    width, height = mask.get_size()
+    return surface_bytes(surface) + width * height // 8
+
+
+class LRUCache:
+    """
+    A memory bounded cache, the least recently used entries are evicted
+    first when the budget is exceeded
+
+    :max_bytes: int
+    The memory budget of the cache, in bytes
+
+    :sizeof:
+    The function used to get the memory size of a stored value
+    """
+
+    def __init__(self, *, max_bytes: int, sizeof=surface_bytes):
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return f"""{self.__class__.__name__} object ({len(self)} entries, {self.bytes}/{self._max_bytes} bytes)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        self._max_bytes = value
+        self.__evict__()
+
+    def get(self, key, default=None):
+        """
+        LRUCache.get(key, default=None)
+        Return the cached value and mark it as recently used
+        """
+        try:
+            value = self._entries[key][0]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        LRUCache.put(key, value)
+        Store a value, evicting the oldest entries if needed
+        """
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        size = self._sizeof(value)
+        # ! A value bigger than the whole budget is never kept
+        if size > self._max_bytes:
+            return value
+        self._entries[key] = (value, size)
+        self.bytes += size
+        self.__evict__()
+        return value
+
+    def discard(self, key):
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self),
+            "bytes": self.bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __evict__(self):
+        while self.bytes > self._max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
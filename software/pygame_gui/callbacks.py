@@ -0,0 +1,211 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import queue
+import time
+import pygame
+from .profiler import RollingStat
+
+
+# Posted when a callback ran in the background, with its result or its error
+CALLBACK_DONE = pygame.event.custom_type()
+
+# Where a callback runs
+EXECUTION_POLICIES = [
+    "inline",  # on the UI thread, during the frame
+    "thread",  # in a pool of threads, for the I/O
+    "process",  # in a pool of processes, for the computations, the function must be picklable
+]
+
+
+def timed_call(function, args: tuple) -> tuple:
+    """
+    timed_call(function, args:tuple)->tuple
+    Call the function, return its result and how long it ran, in seconds
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+class CallbackExecutor:
+    """
+    This class runs the callbacks in a pool of threads or of processes
+
+    The results and the errors come back to the UI thread as CALLBACK_DONE
+    events, they are applied by CallbackExecutor.poll(), called by the Window
+    between the frames
+
+    :workers: int
+    The number of threads, and of processes, used to run the callbacks
+    """
+
+    def __init__(self, workers: int = 4):
+        self._workers = workers
+        self._threads = None
+        self._processes = None
+        self._ids = itertools.count()
+        # The jobs not applied yet: id -> (submit time, on_result, on_error)
+        self._jobs = dict()
+        # The CALLBACK_DONE events read with the other events, applied by the next poll()
+        self._taken = list()
+        # ! Used when the events can't be posted, before the display is initialized
+        self._done = queue.SimpleQueue()
+        # From the submission to the result applied, and the time spent in the callbacks
+        self.latency = RollingStat()
+        self.run_time = RollingStat()
+        self.completed = 0
+        self.failed = 0
+
+    def __repr__(self):
+        return f"""CallbackExecutor object ({self.pending} pending, {self.completed} completed)"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def pending(self) -> int:
+        """The number of callbacks submitted and not applied yet, the depth of the queue"""
+        return len(self._jobs)
+
+    def __pool__(self, execution: str):
+        # * The pools are only started by their first callback
+        if execution == "thread":
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix="pygame_gui-callbacks"
+                )
+            return self._threads
+        if self._processes is None:
+            # ! multiprocessing is slow to import, only done by the first process callback
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._processes = ProcessPoolExecutor(max_workers=self._workers)
+        return self._processes
+
+    def submit(self, function, execution: str = "thread", on_result=None, on_error=None, *args):
+        """
+        CallbackExecutor.submit(function, execution:str="thread", on_result=None, on_error=None, *args)
+
+        Call function(*args) as told by `execution`, see EXECUTION_POLICIES
+        on_result(result) or on_error(error) are called by poll() on the UI thread,
+        an error without on_error is raised by poll()
+        An inline callback runs now, on_result and on_error too
+        """
+        if execution not in EXECUTION_POLICIES:
+            raise ValueError("Unrecognized execution value, see EXECUTION_POLICIES")
+        if execution == "inline":
+            try:
+                result, seconds = timed_call(function, args)
+            except Exception as error:
+                self.failed += 1
+                if on_error is None:
+                    raise
+                on_error(error)
+                return
+            self.run_time.add(seconds)
+            self.latency.add(seconds)
+            self.completed += 1
+            if on_result is not None:
+                on_result(result)
+            return
+        job = next(self._ids)
+        self._jobs[job] = (time.perf_counter(), on_result, on_error)
+        future = self.__pool__(execution).submit(timed_call, function, args)
+        future.add_done_callback(lambda future: self.__post__(job, future))
+
+    def __post__(self, job: int, future):
+        # ! Called by a thread of the pool, nothing is applied here
+        try:
+            (result, seconds), error = future.result(), None
+        except BaseException as exception:
+            result, seconds, error = None, None, exception
+        attributes = dict(job=job, result=result, error=error, seconds=seconds)
+        try:
+            pygame.event.post(pygame.event.Event(CALLBACK_DONE, attributes))
+        except pygame.error:
+            self._done.put(attributes)
+
+    def take(self, events: list) -> list:
+        """
+        CallbackExecutor.take(events:list)->list
+        Remove the CALLBACK_DONE events from the list, they are applied by the next poll()
+        """
+        if not self._jobs:
+            return events
+        kept = list()
+        for event in events:
+            if event.type == CALLBACK_DONE:
+                self._taken.append(event.dict)
+            else:
+                kept.append(event)
+        return kept
+
+    def poll(self) -> int:
+        """
+        CallbackExecutor.poll()->int
+
+        Apply the results of the callbacks on the calling thread, return how many were applied
+        """
+        if not self._jobs:
+            return 0
+        done = self._taken
+        self._taken = list()
+        try:
+            done += [event.dict for event in pygame.event.get(CALLBACK_DONE)]
+        except pygame.error:
+            pass
+        while True:
+            try:
+                done.append(self._done.get_nowait())
+            except queue.Empty:
+                break
+        applied = 0
+        raised = None
+        for attributes in done:
+            job = self._jobs.pop(attributes["job"], None)
+            if job is None:
+                continue
+            submitted, on_result, on_error = job
+            applied += 1
+            self.latency.add(time.perf_counter() - submitted)
+            error = attributes["error"]
+            if error is not None:
+                self.failed += 1
+                if on_error is not None:
+                    on_error(error)
+                elif raised is None:
+                    # * The other results are applied before raising
+                    raised = error
+                continue
+            self.completed += 1
+            self.run_time.add(attributes["seconds"])
+            if on_result is not None:
+                on_result(attributes["result"])
+        if raised is not None:
+            raise raised
+        return applied
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "latency": self.latency.summary(),
+            "run_time": self.run_time.summary(),
+        }
+
+    def shutdown(self, wait: bool = True):
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=wait)
+        self._threads = None
+        self._processes = None
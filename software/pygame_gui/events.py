@@ -0,0 +1,131 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+import pygame
+
+
+# The events sent only to the widget under the pointer
+POINTER_EVENTS = frozenset(
+    (
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+    )
+)
+
+
+class EventDispatcher:
+    """
+    This class sorts the events of a frame by type, and only feeds the
+    widgets subscribed to those types
+
+    A widget subscribes to the types listed in its `EVENTS` attribute,
+    None meaning all the events on every frame
+    """
+
+    def __init__(self):
+        # The widgets subscribed to each event type
+        self._types = dict()
+        # The widgets fed on every frame, even without any event
+        self._always = set()
+        self._widgets = set()
+
+    def __repr__(self):
+        return f"""EventDispatcher object ({len(self._widgets)} widgets, {len(self._types)} types)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def __contains__(self, widget):
+        return widget in self._widgets
+
+    def subscribe(self, widget):
+        """
+        EventDispatcher.subscribe(widget)
+        Register the widget for the events it handles
+        """
+        self.unsubscribe(widget)
+        if widget.EVENTS is None:
+            self._always.add(widget)
+            self._widgets.add(widget)
+            return
+        for type_ in widget.EVENTS:
+            self._types.setdefault(type_, set()).add(widget)
+        if widget._feed_every_frame:
+            self._always.add(widget)
+        if widget.EVENTS or widget._feed_every_frame:
+            self._widgets.add(widget)
+
+    def unsubscribe(self, widget):
+        """
+        EventDispatcher.unsubscribe(widget)
+        Stop feeding the widget, nothing happens if it is not subscribed
+        """
+        if widget not in self._widgets:
+            return
+        self._widgets.discard(widget)
+        self._always.discard(widget)
+        for type_ in list(self._types):
+            widgets = self._types[type_]
+            widgets.discard(widget)
+            if not widgets:
+                del self._types[type_]
+
+    def dispatch(self, events: list, hovered=None, profiler=None, hidden=()):
+        """
+        EventDispatcher.dispatch(events:list, hovered=None, profiler=None, hidden=())
+
+        Feed every subscribed widget with the events it handles, the pointer
+        events of the widgets reacting to the pointer are only given to the
+        hovered one and to the ones handling the pointer outside of them
+        Each __feed__ is timed by the profiler when one is given
+        The `hidden` widgets, culled by the Window, are not fed
+        """
+        buckets = dict()
+        for index, event in enumerate(events):
+            buckets.setdefault(event.type, list()).append((index, event))
+        targets = set(self._always)
+        for type_ in buckets:
+            widgets = self._types.get(type_)
+            if widgets:
+                targets.update(widgets)
+        targets.difference_update(hidden)
+        for widget in sorted(targets, key=lambda widget: widget._z):
+            pointer = (
+                not widget._pointer or widget is hovered or widget._pointer_outside
+            )
+            if widget.EVENTS is None:
+                received = [
+                    event
+                    for event in events
+                    if pointer or event.type not in POINTER_EVENTS
+                ]
+            else:
+                found = [
+                    item
+                    for type_ in widget.EVENTS
+                    if pointer or type_ not in POINTER_EVENTS
+                    for item in buckets.get(type_, ())
+                ]
+                if not found and not widget._feed_every_frame:
+                    continue
+                # * Keep the order the events came in
+                found.sort(key=lambda item: item[0])
+                received = [event for _, event in found]
+            if profiler is None:
+                widget.__feed__(received)
+            else:
+                profiler.time_widget(widget, "feed", widget.__feed__, received)
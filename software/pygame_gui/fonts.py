@@ -0,0 +1,88 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+import pygame
+
+
+class FontRegistry:
+    """
+    This class keeps the fonts used by the GUI, so each font is only
+    looked up and loaded once
+
+    :family: str
+    The font family used when none is given
+    """
+
+    def __init__(self, family: str):
+        self._family = family
+        self._fonts = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"""FontRegistry object ({len(self._fonts)} fonts, {self.hits} hits, {self.misses} misses)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __len__(self):
+        return len(self._fonts)
+
+    @property
+    def family(self):
+        return self._family
+
+    def get(
+        self,
+        size: int,
+        family: str | None = None,
+        bold: bool = False,
+        italic: bool = False,
+    ) -> pygame.font.Font:
+        """
+        FontRegistry.get(size:int, family:str=None, bold:bool=False, italic:bool=False)->pygame.font.Font
+        Return the font, only the first call for a given font touches the filesystem
+        """
+        if family is None:
+            family = self._family
+        key = (family, size, bool(bold), bool(italic))
+        font = self._fonts.get(key)
+        if font is None:
+            self.misses += 1
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.SysFont(family, size, bold, italic)
+            self._fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    def preload(
+        self,
+        sizes,
+        family: str | None = None,
+        bold: bool = False,
+        italic: bool = False,
+    ):
+        """
+        FontRegistry.preload(sizes, family:str=None, bold:bool=False, italic:bool=False)
+        Load the fonts before they are needed, the misses are still counted
+        """
+        for size in sizes:
+            self.get(size, family, bold, italic)
+
+    def stats(self) -> dict:
+        return {
+            "fonts": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self._fonts.clear()
@@ -0,0 +1,171 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+import re
+
+
+# A word with the spaces following it, or the spaces starting a paragraph
+TOKEN = re.compile(r"\S+\s*|\s+")
+
+
+def fit(text: str, width: int, measure) -> int:
+    """
+    fit(text:str, width:int, measure)->int
+    The number of characters of the text fitting in the width, at least one
+    """
+    low, high = 1, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if measure(text[:middle]) <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def wrap(text: str, width: int | None, measure) -> list:
+    """
+    wrap(text:str, width:int|None, measure)->list
+
+    Split a paragraph into lines no wider than `width` pixels, between the words,
+    or inside a word longer than a line. `measure` gives the width of a string
+    The lines joined together give back the text
+    """
+    if width is None or not text:
+        return [text]
+    lines = list()
+    line = ""
+    line_width = 0
+    for token in TOKEN.findall(text):
+        # * The spaces at the end of a line are allowed to overflow
+        visible = measure(token.rstrip())
+        if line and line_width + visible > width:
+            lines.append(line)
+            line = ""
+            line_width = 0
+        while not line and visible > width and len(token) > 1:
+            cut = fit(token, width, measure)
+            lines.append(token[:cut])
+            token = token[cut:]
+            visible = measure(token.rstrip())
+        line += token
+        line_width += measure(token)
+    lines.append(line)
+    return lines
+
+
+class TextLayout:
+    """
+    This class splits a text into lines, at the line breaks and, when a width
+    is given, between the words
+
+    When the text changes, only the paragraphs that changed are wrapped again,
+    and only from their last line when text was added at their end
+
+    :measure:
+    The function giving the width of a string in pixels
+
+    :width: int
+    The width of the lines, None to only split at the line breaks
+    """
+
+    def __init__(self, measure, width: int | None = None):
+        self._measure = measure
+        self._width = width
+        self._text = ""
+        # The (text, lines) of each paragraph
+        self._paragraphs = [("", [""])]
+        self._lines = [""]
+        # The number of characters wrapped by the last change, to check it stays small
+        self.wrapped = 0
+
+    def __repr__(self):
+        return f"""TextLayout object ({len(self._lines)} lines, width {self._width})"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __len__(self):
+        return len(self._lines)
+
+    @property
+    def lines(self) -> list:
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def width(self) -> int | None:
+        return self._width
+
+    def set_width(self, width: int | None) -> int | None:
+        """
+        TextLayout.set_width(width:int|None)->int|None
+        Change the width of the lines, return the index of the first changed line
+        """
+        if width == self._width:
+            return None
+        self._width = width
+        return self.reset()
+
+    def reset(self) -> int | None:
+        """
+        TextLayout.reset()->int|None
+        Wrap the whole text again, needed when the measure changed (font or size)
+        Return the index of the first changed line
+        """
+        text = self._text
+        self._text = None
+        self._paragraphs = list()
+        return self.set_text(text)
+
+    def set_text(self, text: str) -> int | None:
+        """
+        TextLayout.set_text(text:str)->int|None
+        Change the text, return the index of the first changed line,
+        None if no line changed
+        """
+        if text == self._text:
+            return None
+        known = dict(self._paragraphs)
+        last = self._paragraphs[-1] if self._paragraphs else None
+        paragraphs = list()
+        self.wrapped = 0
+        for paragraph in text.split("\n"):
+            lines = known.get(paragraph)
+            if lines is None:
+                if last is not None and last[0] and paragraph.startswith(last[0]):
+                    # * Text added at the end only changes the last line and the next ones
+                    kept = last[1][:-1]
+                    start = sum(len(line) for line in kept)
+                    lines = kept + wrap(paragraph[start:], self._width, self._measure)
+                    self.wrapped += len(paragraph) - start
+                else:
+                    lines = wrap(paragraph, self._width, self._measure)
+                    self.wrapped += len(paragraph)
+            paragraphs.append((paragraph, lines))
+        old = self._lines
+        self._text = text
+        self._paragraphs = paragraphs
+        self._lines = [line for _, lines in paragraphs for line in lines]
+        for index, (line, previous) in enumerate(zip(self._lines, old)):
+            if line != previous:
+                return index
+        if len(self._lines) != len(old):
+            return min(len(self._lines), len(old))
+        return None
+
+    def content_width(self) -> int:
+        """
+        TextLayout.content_width()->int
+        The width of the widest line, in pixels
+        """
+        return max(self._measure(line.rstrip()) for line in self._lines)
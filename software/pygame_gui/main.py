@@ -7,13 +7,25 @@
 
 
 # Imports
-import pygame_vkeyboard as vkboard
 import pygame
 import sys
-import os
 import time
-
-SURFACE = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+import types
+from .cache import LRUCache, image_bytes
+from .fonts import FontRegistry
+from .spatial import SpatialGrid
+from .events import EventDispatcher
+from .audio import AudioLibrary
+from .assets import AssetLoader, ASSET_LOADED
+from .timers import Scheduler, Timer, TIMER_POLICIES
+from .profiler import FrameProfiler, RollingStat
+from .trace import TraceRecorder, TraceReplayer
+from .layout import TextLayout
+from .callbacks import CallbackExecutor, CALLBACK_DONE, EXECUTION_POLICIES
+from .bindings import Observable, Binding
+
+# * The display is created by the first Window, see init_display()
+SURFACE = None
 # Constants
 
 
@@ -24,14 +36,213 @@ ALLOWED_STATES = [
 ]
 
 
+def init_display() -> pygame.surface.Surface:
+    """
+    init_display()->pygame.Surface
+    Initialize pygame and create the fullscreen display if it does not exist yet
+    """
+    global SURFACE
+    if not pygame.get_init():
+        pygame.init()
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            # ! No audio device, the GUI still works without sounds
+            pass
+    SURFACE = pygame.display.get_surface()
+    if SURFACE is None:
+        SURFACE = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    return SURFACE
+
+
+_vkboard = None
+
+
+def vkboard():
+    """
+    vkboard()->module
+    Import pygame_vkeyboard on first use, it is only needed by the TextInputs
+    """
+    global _vkboard
+    if _vkboard is None:
+        import pygame_vkeyboard
+
+        _vkboard = pygame_vkeyboard
+    return _vkboard
+
+
+_numpy = None
+
+
+def numpy():
+    """
+    numpy()->module
+    Import numpy on first use, it is only needed by the Canvas
+    """
+    global _numpy
+    if _numpy is None:
+        import numpy
+
+        _numpy = numpy
+    return _numpy
+
+
+_asyncio = None
+
+
+def asyncio():
+    """
+    asyncio()->module
+    Import asyncio on first use, it is only needed by run_async and the coroutine callbacks
+    """
+    global _asyncio
+    if _asyncio is None:
+        import asyncio
+
+        _asyncio = asyncio
+    return _asyncio
+
+
+# The name of the font used by all the texts
+FONT_NAME = "Aptos"
+# Every font is loaded once, see FONTS.stats() to check the hits and misses
+FONTS = FontRegistry(FONT_NAME)
+
+
 # All the texts are using the same font
-def FONT(size: int) -> pygame.font.SysFont:
+def FONT(
+    size: int, family: str | None = None, bold: bool = False, italic: bool = False
+) -> pygame.font.Font:
     """
-    FONT(size:int)->pygame.font.Sysfont
+    FONT(size:int, family:str=None, bold:bool=False, italic:bool=False)->pygame.font.Font
     This function is used to get the font used by all the texts in the GUI
     """
-    font = pygame.font.SysFont("Aptos", size)
-    return font
+    return FONTS.get(size, family, bold, italic)
+
+
+# ! The surfaces stored here are shared between widgets, never draw on them
+# Set TEXT_CACHE.max_bytes to change the memory used by the rendered texts
+TEXT_CACHE = LRUCache(max_bytes=16 * 1024 * 1024)
+
+
+def render_text(
+    text: str,
+    size: int,
+    fg: str,
+    antialias: bool = False,
+    family: str | None = None,
+) -> pygame.surface.Surface:
+    """
+    render_text(text:str, size:int, fg:str, antialias:bool=False, family:str=None)->pygame.Surface
+    Render a text with the GUI font, the result is cached in TEXT_CACHE
+    """
+    if family is None:
+        family = FONTS.family
+    key = (text, family, size, fg, bool(antialias))
+    surface = TEXT_CACHE.get(key)
+    if surface is None:
+        surface = TEXT_CACHE.put(
+            key, FONT(size, family).render(text, antialias, fg)
+        )
+    return surface
+
+
+# * pygame-ce has Surface.fblits, a faster Surface.blits without the returned rects
+FAST_BLITS = hasattr(pygame.Surface, "fblits")
+
+
+def blit_batch(surf: pygame.surface.Surface, batch: list):
+    """
+    blit_batch(surf:pygame.Surface, batch:list)
+    Draw the (surface, position) pairs onto the surface, in order, with a single call
+    """
+    if FAST_BLITS:
+        surf.fblits(batch)
+    else:
+        surf.blits(batch, doreturn=False)
+
+
+# The number of opaque widgets, the largest ones, checked to cull the widgets under them
+MAX_OCCLUDERS = 8
+
+
+def merge_rects(rects: list) -> list:
+    """
+    merge_rects(rects:list)->list
+    Merge the overlapping rectangles together, so no area is drawn twice
+    """
+    merged = list()
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if rect.w <= 0 or rect.h <= 0:
+            continue
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+# ! The surfaces and masks stored here are shared between widgets, never draw on them
+# Set IMAGE_CACHE.max_bytes to change the memory used by the images
+IMAGE_CACHE = LRUCache(max_bytes=64 * 1024 * 1024, sizeof=image_bytes)
+
+
+def prepare_image(image: pygame.surface.Surface, size: tuple | None = None) -> tuple:
+    """
+    prepare_image(image:pygame.Surface, size:tuple=None)->tuple
+    Convert a decoded image to the display format, resize it if a size is given,
+    and return it with its collision mask
+    """
+    if pygame.display.get_surface() is not None:
+        if image.get_flags() & pygame.SRCALPHA or image.get_colorkey() is not None:
+            image = image.convert_alpha()
+        else:
+            image = image.convert()
+    if size is not None and tuple(size) != image.get_size():
+        if image.get_bitsize() < 24:
+            # ! smoothscale only takes 32 and 24 bits images, like the palette PNGs before a display exists
+            copy = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+            copy.blit(image, (0, 0))
+            image = copy
+        image = pygame.transform.smoothscale(image, size)
+    return image, pygame.mask.from_surface(image)
+
+
+def cache_image(path: str, size: tuple | None, image: pygame.surface.Surface) -> tuple:
+    """
+    cache_image(path:str, size:tuple|None, image:pygame.Surface)->tuple
+    Prepare an image decoded elsewhere and store it in IMAGE_CACHE
+    """
+    key = (path, None if size is None else tuple(size))
+    entry = prepare_image(image, size)
+    if pygame.display.get_surface() is None:
+        # ! Not in the display format, it is loaded again once a Window exists
+        return entry
+    return IMAGE_CACHE.put(key, entry)
+
+
+def load_image(path: str, size: tuple | None = None) -> tuple:
+    """
+    load_image(path:str, size:tuple=None)->tuple
+    Return the (surface, mask) of an image, each file and size is only
+    decoded and converted once while it stays in IMAGE_CACHE
+    """
+    key = (path, None if size is None else tuple(size))
+    entry = IMAGE_CACHE.get(key)
+    if entry is None:
+        entry = cache_image(path, size, pygame.image.load(path))
+    return entry
+
+
+def image_cached(path: str, size: tuple | None = None) -> bool:
+    """
+    image_cached(path:str, size:tuple=None)->bool
+    True if the image can be loaded without touching the disk
+    """
+    return (path, None if size is None else tuple(size)) in IMAGE_CACHE
 
 
 # Error classes
@@ -52,6 +263,32 @@ class Widget:
     a configure(self, *, **kwargs)
     and a __feed__(self,events) method defined
     """
+
+    # The Window holding the Widget, set by Window.__setitem__
+    _window = None
+    # True when the Widget has changed since it was last drawn
+    _invalid = True
+    # The area covered by the Widget the last time it was drawn
+    _drawn_rect = None
+    # True for the widgets reacting to the pointer, they are indexed by the Window
+    _pointer = False
+    # True for the widgets that also need the pointer events outside of them
+    _pointer_outside = False
+    # The layer of the Widget, the higher layers are drawn above the lower ones
+    _layer = 0
+    # The drawing order of the Widget in its Window, (layer, order in the layer)
+    _z = (0, 0)
+    # The key of the Widget in its Window
+    _key = None
+    # The event types handled by __feed__, None means all the events on every frame
+    EVENTS = None
+    # True to call __feed__ on every frame, even without any handled event
+    _feed_every_frame = False
+    # The cursor shown while the Widget is hovered, None for the default one
+    CURSOR = None
+    # The draw commands returned by __blits__, kept until the Widget is invalidated
+    _blits = None
+
     def __init__(self):
         self._position = (0,0)
     def __repr__(self):
@@ -81,12 +318,91 @@ class Widget:
         """
         raise NotImplementedError
 
+    def __callback__(self, function, execution: str = "inline"):
+        """
+        Widget.__callback__(function, execution:str="inline")
+
+        Call a callback of the Widget, a coroutine function runs as a task of the Window
+        `execution` tells where the function runs, see EXECUTION_POLICIES
+        """
+        if self._window is not None:
+            self._window.call(function, execution=execution)
+            return
+        result = function.__call__()
+        if isinstance(result, types.CoroutineType):
+            asyncio().run(result)
+
+    def __blits__(self) -> list | None:
+        """
+        Widget.__blits__()->list|None
+
+        The (surface, position) pairs drawing the Widget, in order, so the Window
+        draws many widgets with a single Surface.blits call
+        None when the Widget can only be drawn by __draw__
+        """
+        return None
+
     def configure(self, *args, **kwargs):
         """
         Clean way to edit the Widget's attributes
         """
         raise NotImplementedError
 
+    def get_rect(self) -> pygame.Rect:
+        """
+        Widget.get_rect()->pygame.Rect
+
+        The area covered by the Widget on the surface
+        A Widget without a _size may draw anywhere, it covers the whole display:
+        it is never culled while visible, and redrawn with every change
+        """
+        size = getattr(self, "_size", None)
+        if size is not None:
+            return pygame.Rect(*self._position, *size)
+        surface = pygame.display.get_surface()
+        if surface is None:
+            return pygame.Rect(0, 0, 0, 0)
+        return surface.get_rect()
+
+    def __hit__(self, pos) -> bool:
+        """
+        Widget.__hit__(pos)->bool
+
+        True if the point is on the Widget, used to find the widget under the pointer
+        """
+        return self.get_rect().collidepoint(pos)
+
+    def __opaque__(self) -> bool:
+        """
+        Widget.__opaque__()->bool
+
+        True if the Widget covers every pixel of get_rect(), the widgets fully
+        under it are neither drawn nor fed
+        """
+        return False
+
+    def __hovered__(self) -> bool:
+        """
+        Widget.__hovered__()->bool
+
+        True if the Widget is the topmost widget under the pointer
+        """
+        if self._window is None:
+            return self.__hit__(pygame.mouse.get_pos())
+        return self._window._hovered is self
+
+    def invalidate(self):
+        """
+        Widget.invalidate()
+
+        Mark the Widget as changed, so it is drawn again on the next frame
+        when the Window uses dirty rectangles
+        """
+        self._invalid = True
+        self._blits = None
+        if self._window is not None:
+            self._window.__invalidate__(self)
+
 
 class Image(Widget):
     """
@@ -105,9 +421,15 @@ class Image(Widget):
     :resize:tuple
     redim the image to fit the specified size, not recomended
 
+    :loader: AssetLoader
+    Decode the image in the background, with Window.assets for example.
+    Nothing is displayed until the image is loaded
+
 
     """
 
+    EVENTS = ()
+
     def __init__(
         self,
         *,
@@ -115,19 +437,41 @@ class Image(Widget):
         path: str,
         transparency: int = 255,
         resize: tuple | None = None,
+        loader=None,
     ) -> None:
-        self._image = pygame.image.load(path)
         self._position = position
         self._path = path
         self._resize = resize
-        self._image.convert_alpha()
-        if self._resize is not None:
-            pygame.transform.scale(self._image, self._resize)
-        self._surf = pygame.Surface(self._image.get_size())
-        self._surf.blit(self._image, (0, 0))
-        self._surf.convert_alpha()
         self._transparency = transparency
-        self._surf.set_alpha(transparency)
+        self._loader = loader
+        self.__load__()
+
+    def __load__(self):
+        path, resize = self._path, self._resize
+        if self._loader is None or image_cached(path, resize):
+            self.__set_image__(load_image(path, resize))
+        else:
+            placeholder = self._loader.load_image(
+                path, lambda image: self.__loaded__(path, resize, image), resize
+            )
+            self.__set_image__((placeholder, pygame.mask.Mask(placeholder.get_size())))
+
+    def __loaded__(self, path, resize, image: pygame.surface.Surface):
+        entry = cache_image(path, resize, image)
+        # ! The path may have been changed while the image was loading
+        if (path, resize) == (self._path, self._resize):
+            self.__set_image__(entry)
+
+    def __set_image__(self, entry: tuple):
+        self._entry = entry
+        self._image, self._collide = entry
+        if self._transparency == 255:
+            self._surf = self._image
+        else:
+            # * The cached image is shared, the transparency is set on a copy
+            self._surf = self._image.copy()
+            self._surf.set_alpha(self._transparency)
+        self.invalidate()
 
     def __repr__(self):
         return f"""Image object at {self._position}"""
@@ -140,7 +484,19 @@ class Image(Widget):
 
     def __draw__(self, surf: pygame.surface.Surface):
         surf.blit(self._surf, self._position)
-        self._feed
+
+    def __blits__(self):
+        return [(self._surf, self._position)]
+
+    def __opaque__(self):
+        return (
+            self._transparency == 255
+            and not self._surf.get_flags() & pygame.SRCALPHA
+            and self._surf.get_colorkey() is None
+        )
+
+    def get_rect(self):
+        return self._surf.get_rect(topleft=self._position)
 
     def configure(
         self,
@@ -149,20 +505,23 @@ class Image(Widget):
         transparency: int | None = None,
         resize: tuple | None = None,
     ):
-        if position is None:
-            position = self._position
-        if path is None:
-            path = self._path
-        if transparency is None:
-            transparency = self._transparency
-        if resize is None:
-            resize = self._resize
-        self.__init__(
-            position=position,
-            path=path,
-            transparency=transparency,
-            resize=resize,
-        )
+        # * Only what depends on the changed attributes is rebuilt
+        if position is not None and position != self._position:
+            self._position = position
+            self.invalidate()
+        reload = False
+        if path is not None and path != self._path:
+            self._path = path
+            reload = True
+        if resize is not None and resize != self._resize:
+            self._resize = resize
+            reload = True
+        if transparency is not None and transparency != self._transparency:
+            self._transparency = transparency
+            if not reload:
+                self.__set_image__(self._entry)
+        if reload:
+            self.__load__()
 
 
 class TextInput(Widget):
@@ -197,6 +556,10 @@ class TextInput(Widget):
 
     """
 
+    _pointer = True
+    # * The keystrokes are handled by the keyboard of the Window, see KeyboardManager
+    EVENTS = (pygame.MOUSEBUTTONUP, pygame.FINGERUP)
+
     def __init__(
         self,
         *,
@@ -210,7 +573,6 @@ class TextInput(Widget):
     ):
         self._size = size
         self._position = position
-        self._layout = vkboard.VKeyboardLayout(vkboard.VKeyboardLayout.AZERTY)
         self._active = False
         self.text = ""
         self._bg = bg
@@ -219,14 +581,6 @@ class TextInput(Widget):
         self._text_offset = text_offset
         self._transparency = transparency
         self._rect = pygame.rect.Rect(*self._position, *self._size)
-        self._keyboard = vkboard.VKeyboard(
-            SURFACE,
-            self.__update_text__,
-            self._layout,
-            renderer=vkboard.VKeyboardRenderer.DARK,
-            show_text=True,
-            joystick_navigation=True,
-        )
 
         self._text_area = Label(
             position=self._position,
@@ -242,35 +596,31 @@ class TextInput(Widget):
     def __draw__(self, surf):
         self._text_area.__draw__(surf=surf)
 
-        rects = self._keyboard.draw(surface=surf, force=True)
-        pygame.display.update(rects)
+    def __blits__(self):
+        return self._text_area.__blits__()
+
+    def __opaque__(self):
+        return self._text_area.__opaque__()
+
+    def get_rect(self):
+        return pygame.Rect(self._rect)
 
     def __feed__(self, events):
         for event in events:
-            if event.type == pygame.MOUSEBUTTONUP:
-                if self._rect.collidepoint(*pygame.mouse.get_pos()):
-                    self._active = True
-                elif self._active and not self._keyboard.get_rect().collidepoint(
-                    *pygame.mouse.get_pos()
-                ):
-                    self._active = False
-            if event.type == pygame.FINGERUP:
-                if self._rect.collidepoint(event.pos):
-                    if self._rect.collidepoint(*event.pos):
-                        self._active = True
-                    elif self._active and not self._keyboard.get_rect().collidepoint(
-                        *event.pos
-                    ):
-                        self._active = False
+            if event.type in (pygame.MOUSEBUTTONUP, pygame.FINGERUP) and self.__hovered__():
+                self._window.keyboard.focus(self)
         self._text_area.__feed__(events)
-        if self._active:
-            self._keyboard.enable()
-            self._keyboard.update(events)
-        else:
-            self._keyboard.disable()
 
     def __update_text__(self, text):
-        self._text_area.configure(text_value=text)
+        self.text = text
+        label = self._text_area
+        label.configure(text_value=text)
+        # * The text scrolls to the left so its end stays visible,
+        # * its width is the one of the rendered line, found in TEXT_CACHE
+        width = label.__line__(len(label._layout) - 1).get_width()
+        overflow = width + self._text_offset[0] - self._size[0]
+        label.configure(scroll=(max(0, overflow), 0))
+        self.invalidate()
 
     def configure(
         self,
@@ -282,33 +632,35 @@ class TextInput(Widget):
         text_offset: tuple | None = None,
         transparency: int | None = None,
     ):
-        if position is None:
-            position = self._position
-        if size is None:
-            size = self._size
-        if bg is None:
-            bg = self._bg
-        if fg is None:
-            fg = self._fg
-        if text_size is None:
-            text_size = self._text_size
-        if text_offset is None:
-            text_offset = self._text_offset
-        if transparency is None:
-            transparency = self._transparency
-        self.__init__(
-            position=position,
-            size=size,
-            bg=bg,
-            fg=fg,
-            text_size=text_size,
-            text_offset=text_offset,
-            transparency=transparency,
-        )
+        # * Only the Label is updated
+        if position is not None:
+            self._position = position
+        if size is not None:
+            self._size = size
+        if bg is not None:
+            self._bg = bg
+        if fg is not None:
+            self._fg = fg
+        if text_size is not None:
+            self._text_size = text_size
+        if text_offset is not None:
+            self._text_offset = text_offset
+        if transparency is not None:
+            self._transparency = transparency
+        self._rect = pygame.rect.Rect(*self._position, *self._size)
+        if self._text_area.configure(
+            position=self._position,
+            size=self._size,
+            background=self._bg,
+            foreground=self._fg,
+            text_size=self._text_size,
+            text_offset=self._text_offset,
+            transparency=self._transparency,
+        ):
+            self.invalidate()
 
 
 class Button(Widget):
-    # TODO: add a method to determinate if the button is at the top layer
     """
     This class is used to display buttons, whose can run a function on a click
 
@@ -342,8 +694,15 @@ class Button(Widget):
     :state: str
     The state of the button, `enabled` or `disabled`
 
+    :execution: str
+    Where `onclick` runs, see EXECUTION_POLICIES
+
     """
 
+    _pointer = True
+    EVENTS = (pygame.MOUSEBUTTONUP,)
+    CURSOR = pygame.SYSTEM_CURSOR_HAND
+
     def __init__(
         self: "Button",
         *,
@@ -357,7 +716,11 @@ class Button(Widget):
         text_offset: tuple = (0, 0),
         transparency: int = 255,
         state: str = "enabled",
+        execution: str = "inline",
     ):
+        if execution not in EXECUTION_POLICIES:
+            raise ValueError("Unrecognized execution value, see EXECUTION_POLICIES")
+        self._execution = execution
         if state in ALLOWED_STATES:
             self._state = state
         else:
@@ -370,8 +733,9 @@ class Button(Widget):
         self._fg = fg
         self._transparency = transparency
         self._onclick = onclick
+        self._text_offset = text_offset
         self._rect = pygame.Rect(*self._position, *self._size)
-        self._text_area = FONT(self._text_size).render(self._text, 0, fg)
+        self._text_area = render_text(self._text, self._text_size, fg)
         self._surf = pygame.Surface(self._size)
         self._surf.fill(bg)
         self._surf.blit(self._text_area, text_offset)
@@ -399,16 +763,17 @@ class Button(Widget):
         if text_size is not None:
             self._text_size = text_size
         if text_offset is not None:
-            self._bg = text_offset
+            self._text_offset = text_offset
         if transparency is not None:
             self._transparency = transparency
         if state is not None:
             self._state = state
 
-        self._text_area = FONT(self._text_size).render(self._text, 0, self._fg)
+        self._text_area = render_text(self._text, self._text_size, self._fg)
         self._surf.fill(self._bg)
         self._surf.blit(self._text_area, self._text_offset)
         self._surf.set_alpha(self._transparency)
+        self.invalidate()
 
     def __repr__(self):
         return f"""Button object at {self._position}"""
@@ -418,22 +783,27 @@ class Button(Widget):
 
     def __feed__(self, events):
         clicked = False
+        hovered = self.__hovered__()
         for event in events:
             if event.type == pygame.MOUSEBUTTONUP and self._state == "enabled":
-                if self._rect.collidepoint(*pygame.mouse.get_pos()):
+                if hovered:
                     clicked = True
-        if self._rect.collidepoint(*pygame.mouse.get_pos()):
-            pygame.mouse.set_cursor(11)
-        else:
-            pygame.mouse.set_cursor(0)
         if clicked:
-            self._onclick.__call__()
+            self.__callback__(self._onclick, self._execution)
 
     def __draw__(self, surf):
         surf.blit(self._surf, self._position)
         if self._state == "disabled":
             surf.blit(self._mask, self._position)
 
+    def __blits__(self):
+        if self._state == "disabled":
+            return [(self._surf, self._position), (self._mask, self._position)]
+        return [(self._surf, self._position)]
+
+    def __opaque__(self):
+        return self._transparency == 255
+
 
 class Label(Widget):
     """
@@ -463,9 +833,17 @@ class Label(Widget):
     :transparency: int
     The transparency of the widget
 
+    :wrap: bool
+    Set it to True to split the lines longer than the widget between the words
+
+    :scroll: tuple
+    The number of pixels the text is moved to the left and to the top,
+    the text outside of the widget is not drawn
 
     """
 
+    EVENTS = ()
+
     def __init__(
         self: "Label",
         *,
@@ -477,6 +855,8 @@ class Label(Widget):
         text_size: int,
         text_offset: tuple = (0, 0),
         transparency=255,
+        wrap: bool = False,
+        scroll: tuple = (0, 0),
     ):
         self._size = size
         self._position = position
@@ -484,14 +864,61 @@ class Label(Widget):
         self._bg = bg
         self._fg = fg
         self._text_size = text_size
-        self._text_area = FONT(self._text_size).render(self._text, 0, fg)
-        self._surf = pygame.Surface(self._size)
-        self._surf.fill(bg)
-        self._surf.blit(self._text_area, text_offset)
-        self._surf.convert_alpha()
-        self._surf.set_alpha(transparency)
         self._text_offset = text_offset
         self._transparency = transparency
+        self._wrap = wrap
+        self._scroll = scroll
+        self._surf = pygame.Surface(self._size)
+        self._layout = TextLayout(self.__measure__, self.__line_width__())
+        self._layout.set_text(self._text)
+        self.__render__()
+
+    def __measure__(self, text: str) -> int:
+        return FONT(self._text_size).size(text)[0]
+
+    def __line_width__(self) -> int | None:
+        return self._size[0] - self._text_offset[0] if self._wrap else None
+
+    @property
+    def content_size(self) -> tuple:
+        """The size of the whole text, in pixels, to know how far it can scroll"""
+        return (
+            self._layout.content_width(),
+            len(self._layout) * FONT(self._text_size).get_linesize(),
+        )
+
+    @content_size.setter
+    def content_size(self, value):
+        raise NotAllowedError()
+
+    def __line__(self, index: int) -> pygame.surface.Surface:
+        """
+        Label.__line__(index:int)->pygame.Surface
+        The rendered line, cached in TEXT_CACHE
+        ! A line is always rendered whole, the kerning changes its width
+        """
+        return render_text(self._layout.lines[index].rstrip(), self._text_size, self._fg)
+
+    def __render__(self, first: int = 0):
+        """
+        Label.__render__(first:int=0)
+        Rebuild the surface of the Label, only needed when an attribute changed
+        The lines before `first` did not change, they are not drawn again
+        """
+        height = FONT(self._text_size).get_linesize()
+        x = self._text_offset[0] - self._scroll[0]
+        y = self._text_offset[1] - self._scroll[1]
+        top = max(0, y + first * height) if first else 0
+        area = pygame.Rect(0, top, self._size[0], max(0, self._size[1] - top))
+        self._surf.fill(self._bg, area)
+        # * Only the visible lines are rendered, scrolling finds them in TEXT_CACHE
+        lines = self._layout.lines
+        index = max(first, -y // height)
+        while index < len(lines) and y + index * height < self._size[1]:
+            self._surf.blit(self.__line__(index), (x, y + index * height))
+            index += 1
+        self._surf.set_alpha(self._transparency)
+        self.invalidate()
 
     def configure(
         self,
@@ -502,24 +929,63 @@ class Label(Widget):
         text_size: int | None = None,
         text_offset: tuple | None = None,
         transparency: int | None = None,
-    ):
-        if text_value is not None:
-            self._text = text_value
-        if foreground is not None:
+        position: tuple | None = None,
+        size: tuple | None = None,
+        wrap: bool | None = None,
+        scroll: tuple | None = None,
+    ) -> bool:
+        """
+        Label.configure(...)->bool
+        Change the given attributes, return True if the Label changed
+        """
+        moved = False
+        if position is not None and position != self._position:
+            # * Moving the Label does not need to render it again
+            self._position = position
+            self.invalidate()
+            moved = True
+        changed = False
+        relayout = False
+        if size is not None and size != self._size:
+            self._size = size
+            self._surf = pygame.Surface(self._size)
+            changed = True
+        if foreground is not None and foreground != self._fg:
             self._fg = foreground
-        if background is not None:
+            changed = True
+        if background is not None and background != self._bg:
             self._bg = background
-        if text_size is not None:
+            changed = True
+        if text_size is not None and text_size != self._text_size:
             self._text_size = text_size
-        if text_offset is not None:
-            self._bg = text_offset
-        if transparency is not None:
+            changed = relayout = True
+        if text_offset is not None and text_offset != self._text_offset:
+            self._text_offset = text_offset
+            changed = True
+        if transparency is not None and transparency != self._transparency:
             self._transparency = transparency
-
-        self._text_area = FONT(self._text_size).render(self._text, 0, self._fg)
-        self._surf.fill(self._bg)
-        self._surf.blit(self._text_area, self._text_offset)
-        self._surf.set_alpha(self._transparency)
+            changed = True
+        if wrap is not None and wrap != self._wrap:
+            self._wrap = wrap
+            changed = True
+        if scroll is not None and scroll != self._scroll:
+            self._scroll = scroll
+            changed = True
+
+        if relayout:
+            self._layout.reset()
+        if self._layout.set_width(self.__line_width__()) is not None:
+            changed = True
+        first = None
+        if text_value is not None and text_value != self._text:
+            self._text = text_value
+            first = self._layout.set_text(text_value)
+        if changed:
+            self.__render__()
+        elif first is not None:
+            # * Only the text changed, the lines before the first changed one are kept
+            self.__render__(first)
+        return moved or changed or first is not None
 
     def __repr__(self):
         return f"""Label object at {self._position}"""
@@ -531,13 +997,14 @@ class Label(Widget):
         pass
 
     def __draw__(self, surf):
-        self._text_area = FONT(self._text_size).render(self._text, 0, self._fg)
-        self._surf.fill(self._bg)
-        self._surf.blit(self._text_area, self._text_offset)
-        self._surf.convert_alpha()
-        self._surf.set_alpha(self._transparency)
         surf.blit(self._surf, self._position)
 
+    def __blits__(self):
+        return [(self._surf, self._position)]
+
+    def __opaque__(self):
+        return self._transparency == 255
+
 
 class ButtonImage(Widget):
     """
@@ -576,8 +1043,19 @@ class ButtonImage(Widget):
     :state: str
     The state of the button, `enabled` or `disabled`
 
+    :loader: AssetLoader
+    Decode the image in the background, with Window.assets for example.
+    The button can not be clicked until the image is loaded
+
+    :execution: str
+    Where `onclick` runs, see EXECUTION_POLICIES
+
     """
 
+    _pointer = True
+    EVENTS = (pygame.MOUSEBUTTONUP,)
+    CURSOR = pygame.SYSTEM_CURSOR_HAND
+
     def __init__(
         self: "Button",
         *,
@@ -590,26 +1068,57 @@ class ButtonImage(Widget):
         text_offset: tuple = (0, 0),
         transparency: int = 255,
         state: str = "enabled",
+        loader=None,
+        execution: str = "inline",
     ):
+        if execution not in EXECUTION_POLICIES:
+            raise ValueError("Unrecognized execution value, see EXECUTION_POLICIES")
+        self._execution = execution
         self._position = position
         self._text = text
         self._fg = fg
         self._onclick = onclick
         self._text_size = text_size
         self._path = path
-        self._image = pygame.image.load(path)
-        self._size = self._image.get_size()
         self._transparency = transparency
-        self._rect = pygame.Rect(*self._position, *self._size)
-        self._text_area = FONT(self._text_size).render(self._text, 0, fg)
         self._state = state
+        self._text_offset = text_offset
+        self._loader = loader
+        self.__render__()
+        if loader is None or image_cached(path):
+            self.__set_image__(load_image(path))
+        else:
+            placeholder = loader.load_image(
+                path, lambda image: self.__loaded__(path, image)
+            )
+            self.__set_image__((placeholder, pygame.mask.Mask(placeholder.get_size())))
+
+    def __render__(self):
+        self._text_area = render_text(self._text, self._text_size, self._fg)
+        if self._transparency != 255:
+            # * The rendered text is shared, the transparency is set on a copy
+            self._text_area = self._text_area.copy()
+            self._text_area.set_alpha(self._transparency)
+        self.invalidate()
+
+    def __loaded__(self, path, image: pygame.surface.Surface):
+        entry = cache_image(path, None, image)
+        if path == self._path:
+            self.__set_image__(entry)
+
+    def __set_image__(self, entry: tuple):
+        self._entry = entry
+        self._image, self._collide = entry
+        if self._transparency != 255:
+            # * The cached image is shared, the transparency is set on a copy
+            self._image = self._image.copy()
+            self._image.set_alpha(self._transparency)
+        self._size = self._image.get_size()
+        self._rect = pygame.Rect(*self._position, *self._size)
         self._mask = pygame.Surface(self._size)
         self._mask.fill("#202020")
         self._mask.set_alpha(150)
-        self._text_offset = text_offset
-        self._image.set_alpha(self._transparency)
-        self._text_area.set_alpha(self._transparency)
-        self._collide = pygame.mask.from_surface(self._image)
+        self.invalidate()
 
     def __repr__(self):
         return f"""ButtonImage object at {self._position}"""
@@ -627,27 +1136,54 @@ class ButtonImage(Widget):
         if self._state == "disabled":
             surf.blit(self._mask, self._position)
 
+    def __blits__(self):
+        blits = [
+            (self._image, self._position),
+            (
+                self._text_area,
+                tuple(p + o for p, o in zip(self._position, self._text_offset)),
+            ),
+        ]
+        if self._state == "disabled":
+            blits.append((self._mask, self._position))
+        return blits
+
+    def __opaque__(self):
+        return (
+            self._transparency == 255
+            and not self._image.get_flags() & pygame.SRCALPHA
+            and self._image.get_colorkey() is None
+            # ! The text may go out of the image
+            and self.get_rect().size == self._size
+        )
+
+    def get_rect(self):
+        rect = pygame.Rect(*self._position, *self._size)
+        return rect.union(
+            self._text_area.get_rect(
+                topleft=tuple(p + o for p, o in zip(self._position, self._text_offset))
+            )
+        )
+
+    def __hit__(self, pos):
+        if not self._rect.collidepoint(pos):
+            return False
+        return bool(
+            self._collide.get_at((pos[0] - self._position[0], pos[1] - self._position[1]))
+        )
+
     def __feed__(self, events):
         clicked = False
-        if self._rect.collidepoint(*pygame.mouse.get_pos()):
-            local_x, local_y = pygame.mouse.get_pos()
-            local_x -= self._position[0]
-            local_y -= self._position[1]
-            for event in events:
-                if (
-                    event.type == pygame.MOUSEBUTTONUP
-                    and self._state == "enabled"
-                    and self._collide.get_at((local_x, local_y))
-                ):
-                    clicked = True
-            if self._collide.get_at((local_x, local_y)):
-                pygame.mouse.set_cursor(11)
-            else:
-                pygame.mouse.set_cursor(0)
-        else:
-            pygame.mouse.set_cursor(0)
+        hovered = self.__hovered__()
+        for event in events:
+            if (
+                event.type == pygame.MOUSEBUTTONUP
+                and self._state == "enabled"
+                and hovered
+            ):
+                clicked = True
         if clicked:
-            self._onclick.__call__()
+            self.__callback__(self._onclick, self._execution)
 
     def configure(
         self,
@@ -658,29 +1194,32 @@ class ButtonImage(Widget):
         transparency: int | None = None,
         state: str | None = None,
     ):
-        if position is None:
-            position = self._position
-        if fg is None:
-            fg = self._fg
-        if text_size is None:
-            text_size = self._text_size
-        if text_offset is None:
-            text_offset = self._text_offset
-        if transparency is None:
-            transparency = self._transparency
-        if state is None:
-            state = self._state
-        self.__init__(
-            position=position,
-            onclick = self._onclick,
-            text=self._text,
-            path = self._path,
-            fg=fg,
-            text_size=text_size,
-            text_offset=text_offset,
-            transparency=transparency,
-            state=state,
-        )
+        # * The image is never loaded again, only the text is rendered when needed
+        if position is not None and position != self._position:
+            self._position = position
+            self._rect = pygame.Rect(*self._position, *self._size)
+            self.invalidate()
+        render = False
+        if fg is not None and fg != self._fg:
+            self._fg = fg
+            render = True
+        if text_size is not None and text_size != self._text_size:
+            self._text_size = text_size
+            render = True
+        if transparency is not None and transparency != self._transparency:
+            self._transparency = transparency
+            self.__set_image__(self._entry)
+            render = True
+        if render:
+            self.__render__()
+        if text_offset is not None and text_offset != self._text_offset:
+            self._text_offset = text_offset
+            self.invalidate()
+        if state is not None and state != self._state:
+            if state not in ALLOWED_STATES:
+                raise ValueError("Unrecognized state value, see ALLOWED_STATES")
+            self._state = state
+            self.invalidate()
 
 
 class Line(Widget):
@@ -701,6 +1240,8 @@ class Line(Widget):
 
     """
 
+    EVENTS = ()
+
     def __init__(
         self,
         *,
@@ -726,7 +1267,17 @@ class Line(Widget):
         pass
 
     def __draw__(self, surf):
-        pygame.__draw__.line(surf, self._color, self._start, self._end, self._width)
+        pygame.draw.line(surf, self._color, self._start, self._end, self._width)
+
+    def get_rect(self):
+        rect = pygame.Rect(
+            self._topleft,
+            (
+                self._bottomright[0] - self._topleft[0] + 1,
+                self._bottomright[1] - self._topleft[1] + 1,
+            ),
+        )
+        return rect.inflate(self._width * 2, self._width * 2)
 
     def configure(
         self,
@@ -735,20 +1286,25 @@ class Line(Widget):
         color: str | None = None,
         width: int | None = None,
     ):
-        if start is None:
-            start = self._start
-        if end is None:
-            end = self._end
-        if color is None:
-            color = self._color
-        if width is None:
-            width = self._width
-        self.__init__(
-            start=start,
-            end=end,
-            color=color,
-            width=width,
-        )
+        changed = False
+        if start is not None and start != self._start:
+            self._start = start
+            changed = True
+        if end is not None and end != self._end:
+            self._end = end
+            changed = True
+        if changed:
+            start, end = self._start, self._end
+            self._topleft = (min(start[0], end[0]), min(start[1], end[1]))
+            self._bottomright = (max(start[0], end[0]), max(start[1], end[1]))
+        if color is not None and color != self._color:
+            self._color = color
+            changed = True
+        if width is not None and width != self._width:
+            self._width = width
+            changed = True
+        if changed:
+            self.invalidate()
 
 
 class Polygon(Widget):
@@ -769,6 +1325,8 @@ class Polygon(Widget):
 
     """
 
+    EVENTS = ()
+
     def __init__(
         self, *, points: list[tuple], color: str, width: int = 1, fill: bool = False
     ):
@@ -777,12 +1335,27 @@ class Polygon(Widget):
         self._points: list = points
         self._color: str = color
         self._width: int = width
+        self._fill: bool = fill
+
+    def __repr__(self):
+        return f"""Polygon object at {self.get_rect().topleft}"""
+
+    def __str__(self):
+        return repr(self)
 
     def __feed__(self, events):
         pass
 
     def __draw__(self, surf):
-        pygame.__draw__.polygon(surf, self._color, self._points, self._width)
+        pygame.draw.polygon(surf, self._color, self._points, self._width)
+
+    def get_rect(self):
+        xs = [point[0] for point in self._points]
+        ys = [point[1] for point in self._points]
+        rect = pygame.Rect(
+            min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1
+        )
+        return rect.inflate(self._width * 2, self._width * 2)
 
     def configure(
         self,
@@ -791,21 +1364,472 @@ class Polygon(Widget):
         width: int | None = None,
         fill: bool | None = None,
     ):
-        if points is None:
-            points = self._points
-        if fill is None:
-            fill = self._fill
-        if color is None:
-            color = self._color
-        if width is None:
-            width = self._width
-        self.__init__(
-            points=points,
-            fill=fill,
-            color=color,
-            width=width,
+        changed = False
+        if points is not None and points != self._points:
+            self._points = points
+            changed = True
+        if color is not None and color != self._color:
+            self._color = color
+            changed = True
+        if fill is not None and fill != self._fill:
+            self._fill = fill
+            changed = True
+        if width is not None and width != self._width:
+            self._width = width
+            changed = True
+        if self._fill and self._width != 0:
+            self._width = 0
+            changed = True
+        if changed:
+            self.invalidate()
+
+
+class Canvas(Widget):
+    """
+    This Widget draws many lines and polygons at once, given as NumPy arrays
+    The shapes are drawn into a cached surface, only when they change, and
+    the points appended to a line only draw the new segments
+
+    :position: tuple
+    The position of the Canvas
+
+    :size: tuple
+    The size of the Canvas
+
+    :bg: str
+    The background color of the Canvas, None for a transparent background
+
+    :scroll: bool
+    When True, appending points on the right of the Canvas scrolls it to the left,
+    the shapes going out on the left are dropped
+    The x of the points never change, Canvas.scrolled is subtracted to draw them
+
+    """
+
+    EVENTS = ()
+
+    def __init__(
+        self,
+        *,
+        position: tuple,
+        size: tuple,
+        bg: str | None = None,
+        scroll: bool = False,
+    ):
+        self._position = position
+        self._size = size
+        self._bg = bg
+        self._scroll = scroll
+        self._shapes = dict()
+        self._scrolled = 0
+        self._surf = pygame.Surface(size, pygame.SRCALPHA if bg is None else 0)
+        # The time spent drawing the shapes, in seconds
+        self._raster = RollingStat()
+        self.raster_time = 0.0
+        self.__repaint__()
+
+    def __repr__(self):
+        return f"""Canvas object at {self._position} ({len(self._shapes)} shapes)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __feed__(self, events):
+        pass
+
+    def __draw__(self, surf):
+        surf.blit(self._surf, self._position)
+
+    def __blits__(self):
+        return [(self._surf, self._position)]
+
+    def __opaque__(self):
+        return self._bg is not None
+
+    @property
+    def scrolled(self) -> int:
+        """The number of pixels the Canvas scrolled to the left"""
+        return self._scrolled
+
+    @scrolled.setter
+    def scrolled(self, value):
+        raise NotAllowedError()
+
+    def __parts__(self, points) -> list:
+        np = numpy()
+        # * The points are copied, they are moved when the Canvas scrolls
+        array = np.array(points, dtype=float)
+        if array.ndim >= 2 and self._scrolled:
+            array[..., 0] -= self._scrolled
+        if array.ndim == 3 and array.shape[2] == 2:
+            # * Shapes of the same size stay in a single array, moved and culled at once
+            return array
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError("The points must be an array of shape (N, 2) or (M, N, 2)")
+        # * A row of NaN splits the array into several lines or polygons
+        gaps = np.isnan(array).any(axis=1)
+        if not gaps.any():
+            return [array]
+        return [part[~np.isnan(part).any(axis=1)] for part in np.split(array, np.flatnonzero(gaps))]
+
+    def __raster__(self, shape: dict, parts: list | None = None, area: pygame.Rect | None = None):
+        if parts is None:
+            parts = shape["parts"]
+        if area is not None and isinstance(parts, numpy().ndarray):
+            # Only the shapes whose bounding box crosses the area are drawn
+            xs = parts[..., 0]
+            parts = parts[(xs.max(axis=1) >= area.left) & (xs.min(axis=1) < area.right)]
+        color, width = shape["color"], shape["width"]
+        if shape["kind"] == "lines":
+            for part in parts:
+                if len(part) < 2:
+                    continue
+                if shape["antialias"]:
+                    pygame.draw.aalines(self._surf, color, False, part.tolist())
+                else:
+                    pygame.draw.lines(self._surf, color, False, part.tolist(), width)
+        else:
+            for part in parts:
+                if len(part) >= 3:
+                    pygame.draw.polygon(self._surf, color, part.tolist(), width)
+
+    def __rastered__(self, start: float):
+        self.raster_time = time.perf_counter() - start
+        self._raster.add(self.raster_time)
+        self.invalidate()
+
+    def __repaint__(self, area: pygame.Rect | None = None):
+        self._surf.set_clip(area)
+        self._surf.fill(self._bg if self._bg is not None else (0, 0, 0, 0), area)
+        for shape in self._shapes.values():
+            self.__raster__(shape, area=area)
+        self._surf.set_clip(None)
+
+    def __redraw__(self):
+        start = time.perf_counter()
+        self.__repaint__()
+        self.__rastered__(start)
+
+    def __put__(self, name, shape: dict):
+        start = time.perf_counter()
+        replaced = name in self._shapes
+        self._shapes[name] = shape
+        if replaced:
+            # ! The previous shape can not be erased alone
+            self.__repaint__()
+        else:
+            self.__raster__(shape)
+        self.__rastered__(start)
+
+    def lines(self, name, points, color: str, width: int = 1, antialias: bool = False):
+        """
+        Canvas.lines(name, points, color:str, width:int=1, antialias:bool=False)
+
+        Draw lines through the points, an array of shape (N, 2), or (M, N, 2)
+        for M lines, a row of NaN also starts a new line
+        The lines replace the shape with the same name
+        """
+        self.__put__(
+            name,
+            {
+                "kind": "lines",
+                "parts": self.__parts__(points),
+                "color": color,
+                "width": width,
+                "antialias": antialias,
+            },
+        )
+
+    def polygons(self, name, points, color: str, width: int = 0):
+        """
+        Canvas.polygons(name, points, color:str, width:int=0)
+
+        Draw polygons, an array of shape (N, 2) for one polygon, or (M, N, 2)
+        for M polygons, a row of NaN also starts a new polygon
+        The polygons are filled when `width` is 0, they replace the shape with the same name
+        """
+        self.__put__(
+            name,
+            {
+                "kind": "polygons",
+                "parts": self.__parts__(points),
+                "color": color,
+                "width": width,
+                "antialias": False,
+            },
         )
 
+    def append(self, name, points):
+        """
+        Canvas.append(name, points)
+
+        Add points, an array of shape (N, 2), at the end of the last line of a shape
+        Only the new segments are drawn, and the Canvas scrolls if it was built
+        with `scroll` and the points are on the right of it
+        """
+        np = numpy()
+        shape = self._shapes[name]
+        if shape["kind"] != "lines":
+            raise ValueError("Points can only be appended to lines")
+        new = np.array(points, dtype=float).reshape(-1, 2)
+        if not len(new):
+            return
+        new[:, 0] -= self._scrolled
+        start = time.perf_counter()
+        shape["parts"] = list(shape["parts"])
+        if self._scroll:
+            overflow = int(np.ceil(new[:, 0].max())) - (self._size[0] - 1)
+            if overflow > 0:
+                # ! Scrolled before adding the points, or the repainted strip would draw them twice
+                self.__shift__(overflow)
+                new[:, 0] -= overflow
+        parts = shape["parts"]
+        parts[-1] = np.concatenate((parts[-1], new))
+        # * The last point already drawn starts the first new segment
+        self.__raster__(shape, [parts[-1][-(len(new) + 1) :]])
+        self.__rastered__(start)
+
+    def __shift__(self, offset: int):
+        np = numpy()
+        self._scrolled += offset
+        self._surf.scroll(-offset, 0)
+        for shape in self._shapes.values():
+            if isinstance(shape["parts"], np.ndarray):
+                parts = shape["parts"]
+                parts[..., 0] -= offset
+                if shape["kind"] == "polygons":
+                    shape["parts"] = parts[parts[..., 0].max(axis=1) >= 0]
+                continue
+            parts = list()
+            for part in shape["parts"]:
+                part[:, 0] -= offset
+                visible = part[:, 0] >= 0
+                if not visible.any():
+                    # * The end of a line is kept, so the next points are joined to it
+                    if shape["kind"] == "lines" and part is shape["parts"][-1]:
+                        parts.append(part[-1:])
+                    continue
+                if shape["kind"] == "lines":
+                    # The segments between two points on the left of the Canvas are never visible
+                    part = part[max(0, int(np.argmax(visible)) - 1) :]
+                parts.append(part)
+            shape["parts"] = parts
+        # * Only the uncovered strip on the right is drawn again
+        width = min(offset, self._size[0])
+        self.__repaint__(pygame.Rect(self._size[0] - width, 0, width, self._size[1]))
+
+    def remove(self, name):
+        if self._shapes.pop(name, None) is not None:
+            self.__redraw__()
+
+    def clear(self):
+        self._shapes.clear()
+        self.__redraw__()
+
+    def stats(self) -> dict:
+        """
+        Canvas.stats()->dict
+        The number of shapes and points, and the time spent drawing them in seconds
+        """
+        return {
+            "shapes": len(self._shapes),
+            "points": sum(len(part) for shape in self._shapes.values() for part in shape["parts"]),
+            "raster": self._raster.summary(),
+        }
+
+    def configure(self, position: tuple | None = None, bg: str | None = None):
+        if position is not None and position != self._position:
+            self._position = position
+            self.invalidate()
+        if bg is not None and bg != self._bg:
+            self._bg = bg
+            self.__redraw__()
+
+
+class CursorManager:
+    """
+    This class sets the cursor of the hovered widget, the cursor is only
+    changed when it differs from the current one
+
+    :default: int
+    The cursor used when no registered widget is hovered
+    """
+
+    def __init__(self, default: int = pygame.SYSTEM_CURSOR_ARROW):
+        self._default = default
+        self._cursors = dict()
+        self._current = None
+        self.changes = 0
+
+    def __repr__(self):
+        return f"""CursorManager object ({len(self._cursors)} widgets, cursor {self._current})"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def current(self):
+        return self._current
+
+    @current.setter
+    def current(self, value):
+        raise NotAllowedError()
+
+    def register(self, widget, cursor):
+        """
+        CursorManager.register(widget, cursor)
+        Show the cursor while the widget is hovered
+        """
+        self._cursors[widget] = cursor
+
+    def unregister(self, widget):
+        self._cursors.pop(widget, None)
+
+    def resolve(self, hovered) -> int:
+        """
+        CursorManager.resolve(hovered)->int
+        Set the cursor of the hovered widget, only if it changed
+        """
+        cursor = self._cursors.get(hovered, self._default)
+        if cursor != self._current:
+            self._current = cursor
+            self.changes += 1
+            try:
+                pygame.mouse.set_cursor(cursor)
+            except pygame.error:
+                # ! Some video drivers (like the dummy one) have no system cursors
+                pass
+        return cursor
+
+
+class KeyboardManager:
+    """
+    This class owns the virtual keyboard shared by all the TextInputs of a Window
+    The keyboard is built when a TextInput is focused for the first time,
+    and the keystrokes only go to the focused TextInput
+
+    :window: Window
+    The Window the keyboard is drawn on
+    """
+
+    def __init__(self, window):
+        self._window = window
+        self._keyboard = None
+        self._focused = None
+        # * The whole keyboard is drawn on the next frame
+        self._force = False
+        self.focus_changes = 0
+
+    def __repr__(self):
+        state = "built" if self._keyboard is not None else "not built"
+        return f"""KeyboardManager object ({state}, focused {self._focused!r})"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def focused(self):
+        """The TextInput receiving the keystrokes, None when the keyboard is hidden"""
+        return self._focused
+
+    @focused.setter
+    def focused(self, value):
+        raise NotAllowedError()
+
+    def __build__(self):
+        vk = vkboard()
+        self._keyboard = vk.VKeyboard(
+            self._window._surf,
+            self.__consume__,
+            vk.VKeyboardLayout(vk.VKeyboardLayout.AZERTY),
+            renderer=vk.VKeyboardRenderer.DARK,
+            show_text=True,
+            joystick_navigation=True,
+        )
+        self._keyboard.disable()
+
+    def __consume__(self, text):
+        if self._focused is not None:
+            self._focused.__update_text__(text)
+
+    def get_rect(self) -> pygame.Rect | None:
+        if self._keyboard is None:
+            return None
+        return self._keyboard.get_rect()
+
+    def focus(self, text_input):
+        """
+        KeyboardManager.focus(text_input:TextInput)
+        Send the keystrokes to the TextInput, the keyboard is shown if it was hidden
+        """
+        if text_input is self._focused:
+            return
+        if self._keyboard is None:
+            self.__build__()
+        if self._focused is None:
+            # ! Showing the keyboard marks all its keys as changed, it is only done once
+            self._keyboard.enable()
+            self._force = True
+        else:
+            self._focused._active = False
+        self._focused = text_input
+        text_input._active = True
+        self._keyboard.set_text(text_input.text)
+        self.focus_changes += 1
+
+    def blur(self):
+        """
+        KeyboardManager.blur()
+        Hide the keyboard, no TextInput receives the keystrokes anymore
+        """
+        if self._focused is None:
+            return
+        self._focused._active = False
+        self._focused = None
+        self._keyboard.disable()
+        self.focus_changes += 1
+        # * The widgets under the keyboard are drawn again, instead of using its eraser
+        self._window._damage.append(self._keyboard.get_rect())
+
+    def update(self, events):
+        """
+        KeyboardManager.update(events)
+        Feed the keyboard with the events, a click outside of the keyboard and
+        the focused TextInput hides it
+        """
+        if self._focused is None:
+            return
+        for event in events:
+            if event.type in (pygame.MOUSEBUTTONUP, pygame.FINGERUP):
+                if not self._focused.__hovered__() and not self._keyboard.get_rect().collidepoint(
+                    self._window.pointer
+                ):
+                    self.blur()
+                    return
+        self._keyboard.update(events)
+
+    def draw(self, rects: list | None) -> list:
+        """
+        KeyboardManager.draw(rects:list|None)->list
+
+        Draw the keyboard over the widgets, `rects` are the areas redrawn
+        in this frame, None when the whole Window was drawn
+        Only the keys that changed are drawn, unless the widgets were drawn over
+        the keyboard. Return the areas drawn
+        """
+        if self._focused is None:
+            return list()
+        keyboard = self._keyboard
+        surf = self._window._surf
+        force = self._force or rects is None or keyboard.get_rect().collidelist(rects) != -1
+        self._force = False
+        if force:
+            # ! VKeyboard.draw(force=True) would repaint the whole keyboard again
+            # on the next frame, the keys are marked to repaint before drawing instead
+            keyboard.set_eraser(surf)
+            keyboard.layout.sprites.repaint_rect(keyboard.background.rect)
+        return keyboard.layout.sprites.draw(surf) + keyboard.input.draw(surf, force)
+
 
 class Window:
     """
@@ -818,108 +1842,710 @@ class Window:
     :fps: int
     The max fps of the Window, leav it to 60 if you don't want any problem
 
+    :font_sizes: tuple
+    The text sizes to load when the Window is created, so the first frames
+    don't have to load fonts
+
+    :dirty: bool
+    Only redraw the areas of the widgets that changed, instead of the whole
+    Window on every frame
+
+    :idle: bool
+    Wait for the events when nothing has to be redrawn, instead of running
+    at the max fps. The Window runs at full speed while some `tick`
+    callbacks are registered
+
+    :sound_budget: int
+    The memory used by the decoded sounds, in bytes. The musics are streamed
+    and don't count
+
+    :profile: bool
+    Time the phases of every frame and each widget, see Window.profiler
+
     """
 
     def __init__(
         self: "Window",
         bg: str,
         fps: int = 60,
+        font_sizes: tuple = (),
+        dirty: bool = False,
+        idle: bool = False,
+        sound_budget: int = 32 * 1024 * 1024,
+        profile: bool = False,
     ):
         #//pygame.mouse.set_visible(False)
         self._bg = bg
         self._FPS = fps
-        self._surf = SURFACE
+        self._surf = init_display()
         self._elements = dict()
         self._runing = False
         self._size = self._surf.get_size()
         self.tick = set()
-        self._begin = time.time()
-        self._after = list()
-        self._sounds = dict()
-        self._musics = dict()
-    def after(self, function, delay):
-        last = self.duration
-        self._after.append([function,delay,last])
+        # The clock of the Window, never going backward
+        self._time = time.monotonic
+        self._begin = self._time()
+        # * The time is read once per frame, so all the callbacks of a frame see the same time
+        self._now = self._begin
+        self.timers = Scheduler(clock=lambda: self._now)
+        # * The audio files are only decoded when they are played
+        self.audio = AudioLibrary(max_bytes=sound_budget)
+        # The images and sounds decoded in the background
+        self.assets = AssetLoader()
+        self._dirty = dirty
+        # The widgets changed since the last frame
+        self._invalid = list()
+        # The areas to redraw on the next frame, the whole Window at first
+        self._damage = [self._surf.get_rect()]
+        self._dirty_rects = list()
+        self._dirty_pixels = 0
+        self._idle = idle
+        # The widgets reacting to the pointer, indexed by their area
+        self._grid = SpatialGrid()
+        self._next_z = 0
+        self._first_z = 0
+        # The widgets sorted by their drawing order, None when it has to be sorted again
+        self._order = None
+        # The widgets drawn and fed, in drawing order, None when it has to be found again
+        self._visible = None
+        # The widgets out of the Window or under an opaque widget
+        self._hidden = set()
+        # The area and the opacity of each widget when the visible ones were found
+        self._placed = dict()
+        self._culled = 0
+        self._pointer = (0, 0)
+        self._hovered = None
+        # * A single virtual keyboard is shared by all the TextInputs
+        self.keyboard = KeyboardManager(self)
+        self._dispatcher = EventDispatcher()
+        self.cursors = CursorManager()
+        self.profiler = FrameProfiler()
+        self.profiler.enabled = profile
+        self._recorder = None
+        # The tasks of the coroutine callbacks, and the tick/after callbacks still running
+        self._tasks = set()
+        self._busy = dict()
+        self._task_error = None
+        self._async = False
+        # * The callbacks not run inline, their results are applied between the frames
+        self.callbacks = CallbackExecutor()
+        FONTS.preload(font_sizes)
+    def after(self, function, delay, repeat=True, policy="coalesce", execution="inline"):
+        """
+        Window.after(function, delay, repeat=True, policy="coalesce", execution="inline")->Timer
+
+        Call the function every `delay` seconds, or only once if `repeat` is False
+        `policy` tells what to do when some calls were missed, see TIMER_POLICIES
+        `execution` tells where the function runs, see EXECUTION_POLICIES
+        Use Timer.cancel() on the returned timer to stop it
+        A coroutine function, or a function not run inline, is not called again while it runs
+        """
+
+        def call():
+            if timer not in self._busy:
+                self.call(function, execution=execution, key=timer)
+
+        timer = self.timers.schedule(call, delay, repeat, policy)
+        return timer
+
+    def bind(self, key, source, attribute="text_value", format=str, max_rate=None) -> Binding:
+        """
+        Window.bind(key, source, attribute="text_value", format=str, max_rate=None)->Binding
+
+        Configure the `attribute` of a widget with the formatted value of the source,
+        an Observable or a function called `max_rate` times per second
+        The widget is only configured when the formatted value changes, and at most
+        `max_rate` times per second. Use Binding.unbind() to stop it
+        """
+        widget = self._elements[key]
+        return Binding(
+            source,
+            lambda value: widget.configure(**{attribute: value}),
+            format,
+            max_rate,
+            self.timers,
+        )
+
+    def call(self, function, *args, execution="thread", on_result=None, on_error=None, key=None):
+        """
+        Window.call(function, *args, execution="thread", on_result=None, on_error=None, key=None)
+
+        Call function(*args) as told by `execution`, see EXECUTION_POLICIES
+        The result is given to on_result(result) between the frames, and a returned
+        coroutine runs as a task. An error is given to on_error(error),
+        or raised between the frames without on_error
+        `key` marks the callback as busy until it is done
+        """
+
+        def done(result):
+            if key is not None:
+                self._busy.pop(key, None)
+            # * A returned coroutine keeps the callback busy until its task is done
+            self.__handle__(result, key)
+            if on_result is not None:
+                on_result(result)
+
+        def failed(error):
+            if key is not None:
+                self._busy.pop(key, None)
+            if on_error is None:
+                raise error
+            on_error(error)
+
+        if key is not None and execution != "inline":
+            self._busy[key] = execution
+        self.callbacks.submit(function, execution, done, failed, *args)
+
+    def __handle__(self, result, key=None):
+        """
+        Window.__handle__(result, key=None)
+
+        Run the coroutine returned by a callback as a task of the running event loop,
+        `key` marks the callback as busy until its task is done
+        Without an event loop the coroutine runs until it ends, blocking the frame
+        """
+        if not isinstance(result, types.CoroutineType):
+            return
+        try:
+            loop = asyncio().get_running_loop()
+        except RuntimeError:
+            asyncio().run(result)
+            return
+        task = loop.create_task(result)
+        self._tasks.add(task)
+        if key is not None:
+            self._busy[key] = task
+        task.add_done_callback(lambda task: self.__done__(task, key))
+
+    def __done__(self, task, key):
+        self._tasks.discard(task)
+        if key is not None and self._busy.get(key) is task:
+            del self._busy[key]
+        if not task.cancelled() and task.exception() is not None and self._task_error is None:
+            # ! The error is raised by run_async, on the next frame
+            self._task_error = task.exception()
+
+    @property
+    def tasks(self) -> int:
+        """The number of coroutine callbacks running"""
+        return len(self._tasks)
+
+    @tasks.setter
+    def tasks(self, value):
+        raise NotAllowedError()
     def add_sound(self, name, path):
-        self._sounds[name] = pygame.mixer.Sound(path)
+        self.audio.add_sound(name, path)
     def play_sound(self, name):
-        pygame.mixer.Sound.play(self._sounds[name])
+        self.audio.play_sound(name)
     def add_music(self, name, path):
-        self._musics[name] = pygame.mixer.Sound(path)
+        self.audio.add_music(name, path)
     def play_music(self, name, count=0):
-        pygame.mixer.Sound.play(self._musics[name], count)
-    def pause_music(self, name):
-        pygame.mixer.music.pause(self._musics[name])
-    def unpause_music(self, name):
-        pygame.mixer.music.unpause(self._musics[name])
-    def stop_music(self, name):
-        pygame.mixer.music.stop(self._musics[name])
+        self.audio.play_music(name, count)
+    def pause_music(self, name=None):
+        self.audio.pause_music(name)
+    def unpause_music(self, name=None):
+        self.audio.unpause_music(name)
+    def stop_music(self, name=None):
+        self.audio.stop_music(name)
     def stop_sound(self, name):
-        pygame.mixer.stop(self._sounds[name])
+        self.audio.stop_sound(name)
     def silence(self):
-        pygame.mixer.stop()
+        self.audio.silence()
     def load_sound_folder(self, path):
-        folder = path
-        for file in os.listdir(folder):
-            if file.endswith(".mp3"):
-                self.add_sound(file.split(".mp3")[0], os.path.join(folder, file))
+        self.audio.load_folder(path)
     def load_music_folder(self, path):
-        folder = path
-        for file in os.listdir(folder):
-            if file.endswith(".mp3"):
-                self.add_music(file.split(".mp3")[0], os.path.join(folder, file))
+        self.audio.load_folder(path, music=True)
+    def preload_sounds(self, *names):
+        """
+        Window.preload_sounds(*names)
+
+        Decode the given sounds in the background, so their first play is instant
+        """
+        for name in names:
+            self.audio.preload_async(name, self.assets)
     
     @property
     def duration(self):
-        return time.time() - self._begin
+        """The time of the current frame, since the creation of the Window"""
+        return self._now - self._begin
 
     @duration.setter
     def duration(self, value):
         raise NotAllowedError()
 
+    @property
+    def dirty_rects(self):
+        """The areas presented on the last frame"""
+        return list(self._dirty_rects)
+
+    @dirty_rects.setter
+    def dirty_rects(self, value):
+        raise NotAllowedError()
+
+    @property
+    def dirty_pixels(self):
+        """The number of pixels presented on the last frame"""
+        return self._dirty_pixels
+
+    @dirty_pixels.setter
+    def dirty_pixels(self, value):
+        raise NotAllowedError()
+
+    @property
+    def culled(self):
+        """The number of widgets skipped on the last frame, out of the Window or under an opaque widget"""
+        return self._culled
+
+    @culled.setter
+    def culled(self, value):
+        raise NotAllowedError()
+
     def __getitem__(self, key):
         return self._elements[key]
 
     def __setitem__(self, key, value):
         if issubclass(type(value), Widget):
+            if key in self._elements:
+                self.__forget__(self._elements[key])
             self._elements[key] = value
+            value._window = self
+            value._key = key
+            value._z = (value._layer, self._next_z)
+            self._next_z += 1
+            self._order = None
+            if value._pointer:
+                self._grid.insert(value, value.get_rect())
+            self._dispatcher.subscribe(value)
+            if value.CURSOR is not None:
+                self.cursors.register(value, value.CURSOR)
+            value.invalidate()
         else:
             raise TypeError("Not a Widget")
     def __delitem__(self, key):
-        del self._elements[key]
+        self.__forget__(self._elements.pop(key))
+
+    def add(self, key, widget, layer: int = 0):
+        """
+        Window.add(key, widget, layer:int=0)
+
+        Same as window[key] = widget, on the given layer: the higher layers are
+        drawn above the lower ones, the widgets of a layer in the order they were added
+        """
+        widget._layer = layer
+        self[key] = widget
+
+    def set_layer(self, key, layer: int):
+        """
+        Window.set_layer(key, layer:int)
+        Move the widget to another layer, above the widgets already there
+        """
+        widget = self._elements[key]
+        widget._layer = layer
+        self.__restack__(widget, self._next_z)
+        self._next_z += 1
+
+    def raise_widget(self, key):
+        """
+        Window.raise_widget(key)
+        Draw the widget above the others of its layer
+        """
+        self.__restack__(self._elements[key], self._next_z)
+        self._next_z += 1
+
+    def lower_widget(self, key):
+        """
+        Window.lower_widget(key)
+        Draw the widget under the others of its layer
+        """
+        self._first_z -= 1
+        self.__restack__(self._elements[key], self._first_z)
+
+    def __restack__(self, widget, order: int):
+        widget._z = (widget._layer, order)
+        self._order = None
+        self._visible = None
+        widget.invalidate()
+
+    def __order__(self) -> list:
+        if self._order is None:
+            self._order = sorted(self._elements.values(), key=lambda widget: widget._z)
+        return self._order
+
+    def __visibility__(self) -> list:
+        """
+        Window.__visibility__()->list
+
+        The widgets to draw and to feed, in drawing order, found again only when
+        a widget changed: the widgets out of the Window, or fully under an opaque
+        widget, are culled
+        """
+        if self._visible is not None:
+            return self._visible
+        screen = self._surf.get_rect()
+        visible = list()
+        hidden = set()
+        placed = dict()
+        # The areas of the largest opaque widgets above the current one
+        occluders = list()
+        for widget in reversed(self.__order__()):
+            rect = widget.get_rect()
+            opaque = widget.__opaque__()
+            placed[widget] = (rect, opaque)
+            if not rect.colliderect(screen):
+                hidden.add(widget)
+                continue
+            rect = rect.clip(screen)
+            if any(area.contains(rect) for area in occluders):
+                hidden.add(widget)
+                continue
+            visible.append(widget)
+            if opaque:
+                occluders.append(rect)
+                if len(occluders) > MAX_OCCLUDERS:
+                    occluders.remove(min(occluders, key=lambda area: area.w * area.h))
+        visible.reverse()
+        self._visible = visible
+        self._hidden = hidden
+        self._placed = placed
+        self._culled = len(hidden)
+        return visible
+
+    def __forget__(self, widget):
+        widget._window = None
+        self._order = None
+        self._visible = None
+        self._grid.remove(widget)
+        self._dispatcher.unsubscribe(widget)
+        self.cursors.unregister(widget)
+        if self._hovered is widget:
+            self._hovered = None
+        if self.keyboard.focused is widget:
+            self.keyboard.blur()
+        if widget._drawn_rect is not None:
+            self._damage.append(widget._drawn_rect)
+            widget._drawn_rect = None
+    def __invalidate__(self, widget):
+        self._invalid.append(widget)
+        # * The visible widgets are only found again when one moved, or its opacity changed
+        if self._visible is not None and self._placed.get(widget) != (
+            widget.get_rect(),
+            widget.__opaque__(),
+        ):
+            self._visible = None
+        if widget._pointer:
+            # * Keep the index up to date when the widget moves or resizes
+            self._grid.move(widget, widget.get_rect())
+    def __validate__(self):
+        # The whole Window has been drawn, nothing is left to redraw
+        for widget in self._invalid:
+            widget._invalid = False
+            widget._drawn_rect = widget.get_rect()
+        self._invalid.clear()
+        self._damage.clear()
     def draw_elements(self):
-        for element in self._elements.values():
-            element.__draw__(self._surf)
+        self.__draw_widgets__(self.__visibility__())
+
+    def __draw_widgets__(self, widgets):
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler is not None:
+            # * Each widget is drawn alone, to be timed
+            for widget in widgets:
+                profiler.time_widget(widget, "draw", widget.__draw__, self._surf)
+            return
+        batch = list()
+        for widget in widgets:
+            blits = widget._blits
+            if blits is None:
+                blits = widget._blits = widget.__blits__()
+                if blits is None:
+                    # * The batch is drawn first, so the widgets keep their order
+                    if batch:
+                        blit_batch(self._surf, batch)
+                        batch = list()
+                    widget.__draw__(self._surf)
+                    continue
+            batch += blits
+        if batch:
+            blit_batch(self._surf, batch)
+
+    def draw_dirty(self) -> list:
+        """
+        Window.draw_dirty()->list
+
+        Clear and redraw only the areas of the widgets that changed
+        Return the list of the redrawn areas
+        """
+        damage = self._damage
+        self._damage = list()
+        for widget in self._invalid:
+            if widget._window is not self or not widget._invalid:
+                continue
+            if widget._drawn_rect is not None:
+                damage.append(widget._drawn_rect)
+            widget._drawn_rect = widget.get_rect()
+            damage.append(widget._drawn_rect)
+            widget._invalid = False
+        self._invalid.clear()
+        screen = self._surf.get_rect()
+        rects = [
+            rect.clip(screen) for rect in merge_rects(damage) if rect.colliderect(screen)
+        ]
+        visible = self.__visibility__()
+        for rect in rects:
+            self._surf.set_clip(rect)
+            self._surf.fill(self._bg, rect)
+            self.__draw_widgets__(
+                element for element in visible if element.get_rect().colliderect(rect)
+            )
+        self._surf.set_clip(None)
+        return rects
 
-    def update_elements(self, events):
-        for element in self._elements.values():
-            element.__feed__(events)
+    @property
+    def pointer(self) -> tuple:
+        """The position of the pointer, read once per frame"""
+        return self._pointer
+
+    @pointer.setter
+    def pointer(self, value):
+        raise NotAllowedError()
+
+    @property
+    def hovered(self):
+        """The topmost widget under the pointer"""
+        return self._hovered
+
+    @hovered.setter
+    def hovered(self, value):
+        raise NotAllowedError()
+
+    def hit(self, pos):
+        """
+        Window.hit(pos)->Widget|None
+
+        Return the topmost widget reacting to the pointer at the given position,
+        the culled widgets are skipped
+        """
+        self.__visibility__()
+        found = None
+        for widget in self._grid.query_point(pos):
+            if widget in self._hidden:
+                continue
+            if (found is None or widget._z > found._z) and widget.__hit__(pos):
+                found = widget
+        return found
+
+    def update_elements(self, events, pointer: tuple | None = None):
+        """
+        Window.update_elements(events, pointer:tuple=None)
+
+        Feed the widgets with the events, `pointer` replaces the position
+        of the mouse when it is given
+        """
+        if pointer is None:
+            pointer = pygame.mouse.get_pos()
+        self._pointer = pointer
+        self._hovered = self.hit(self._pointer)
+        self._dispatcher.dispatch(
+            events,
+            self._hovered,
+            self.profiler if self.profiler.enabled else None,
+            self._hidden,
+        )
+        self.keyboard.update(events)
+        self.cursors.resolve(self._hovered)
+
+    def next_deadline(self) -> float | None:
+        """
+        Window.next_deadline()->float|None
+
+        The number of seconds before the next `after` callback is due,
+        None if there is no callback
+        """
+        return self.timers.time_until_next(self._time())
+
+    def pending(self) -> bool:
+        """
+        Window.pending()->bool
+
+        True when the next frame has something to do without any event:
+        `tick` callbacks or widgets to redraw
+        """
+        return bool(self.tick or self._invalid or self._damage)
+
+    @property
+    def loading(self) -> float:
+        """The progress of the background loading, between 0 and 1"""
+        return self.assets.progress
+
+    @loading.setter
+    def loading(self, value):
+        raise NotAllowedError()
+
+    def __events__(self) -> list:
+        # ! Waiting for the events would block the event loop, run_async sleeps instead
+        if not self._idle or self._async or self.pending():
+            return pygame.event.get()
+        deadline = self.next_deadline()
+        if deadline is None:
+            event = pygame.event.wait()
+        elif deadline > 0:
+            # ! pygame.event.wait(0) would wait forever
+            event = pygame.event.wait(max(1, int(deadline * 1000)))
+        else:
+            return pygame.event.get()
+        if event.type == pygame.NOEVENT:
+            return pygame.event.get()
+        return [event] + pygame.event.get()
+
+    def record(self, path: str):
+        """
+        Window.record(path:str)
+
+        Write the events of every frame into a trace file, until stop_recording()
+        """
+        self.stop_recording()
+        self._recorder = TraceRecorder(path)
+
+    def stop_recording(self):
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def replay(self, path: str, speed: float | None = None) -> dict:
+        """
+        Window.replay(path:str, speed:float=None)->dict
+
+        Run the frames recorded in a trace file, with the recorded clock
+        `speed` is 1 for the recorded speed, None to replay as fast as possible
+        """
+        return TraceReplayer(path).replay(self, speed)
+
+    def show_profiler(self, visible: bool | None = None):
+        """
+        Window.show_profiler(visible:bool=None)
+
+        Show or hide the profiler overlay, toggle it if `visible` is None
+        Showing the overlay enables the profiler
+        """
+        if visible is None:
+            visible = not self.profiler.overlay
+        self.profiler.overlay = visible
+        if visible:
+            self.profiler.enabled = True
+        # * The area of the overlay is cleared on the next frame
+        self._damage.append(self._surf.get_rect())
+
+    def frame(self, events: list | None = None, pointer: tuple | None = None) -> list:
+        """
+        Window.frame(events:list=None, pointer:tuple=None)->list
+
+        Run a single frame: draw, present, then handle the events and the callbacks
+        The events are read from pygame when `events` is None, and `pointer`
+        replaces the position of the mouse when it is given
+        Return the handled events
+        """
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler is not None:
+            start = lap = time.perf_counter()
+        # * The decoded assets are applied, and their widgets invalidated, before drawing
+        self.assets.poll()
+        self.callbacks.poll()
+        if profiler is not None:
+            lap = profiler.lap("assets", lap)
+        if self._dirty:
+            rects = self.draw_dirty()
+            self._dirty_pixels = sum(rect.w * rect.h for rect in rects)
+        else:
+            rects = None
+            self._surf.fill(self._bg)
+            self.draw_elements()
+            self.__validate__()
+            self._dirty_pixels = self._size[0] * self._size[1]
+        if self.keyboard.focused is not None:
+            drawn = self.keyboard.draw(rects)
+            if rects is not None:
+                rects += drawn
+                self._dirty_pixels += sum(rect.w * rect.h for rect in drawn)
+        if self.profiler.overlay:
+            overlay = self.profiler.draw_overlay(self._surf, FONT(14))
+            if rects is not None:
+                rects.append(overlay)
+                self._damage.append(overlay)
+        self._dirty_rects = rects if rects is not None else [self._surf.get_rect()]
+        if profiler is not None:
+            lap = profiler.lap("draw", lap)
+        # * The frame is presented before waiting for the events
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        if profiler is not None:
+            lap = profiler.lap("present", lap)
+        if events is None:
+            events = self.__events__()
+        events = self.callbacks.take(events)
+        if profiler is not None:
+            lap = profiler.lap("wait", lap)
+        if pointer is None:
+            pointer = pygame.mouse.get_pos()
+        self._now = self._time()
+        if self._recorder is not None:
+            self._recorder.record(self.duration, pointer, events)
+        self.update_elements(events=events, pointer=pointer)
+        if profiler is not None:
+            lap = profiler.lap("update", lap)
+        for action in self.tick:
+            if action not in self._busy:
+                self.__handle__(action.__call__(), action)
+        if profiler is not None:
+            lap = profiler.lap("tick", lap)
+        self.timers.run_due()
+        if profiler is not None:
+            profiler.lap("after", lap)
+            profiler.end_frame(start)
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                self.runing = False
+                sys.exit()
+        return events
 
     def run(self):
         self._runing = True
         self._clock = pygame.time.Clock()
         while self._runing:
-            self._surf.fill(self._bg)
-            self.draw_elements()
-            events = pygame.event.get()
-            self.update_elements(events=events)
-            for action in self.tick:
-                action.__call__()
-            now = self.duration
-            for element in self._after:
-                if now - element[2] >= element[1]:
-                    element[2] = now
-                    element[0].__call__()
-                    
-
-            for event in events:
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    self.runing = False
-                    sys.exit()
-            pygame.display.flip()
+            self.frame()
             self._clock.tick(self._FPS)
 
+    async def run_async(self):
+        """
+        Window.run_async()
+
+        Run the frames in a coroutine, use asyncio.run(window.run_async())
+        The event loop runs between the frames, so the I/O of the coroutine
+        callbacks (onclick, tick, after) overlaps with the drawing
+        The running tasks are cancelled when the Window stops
+        """
+        self._runing = True
+        self._async = True
+        try:
+            while self._runing:
+                start = time.perf_counter()
+                self.frame()
+                if self._task_error is not None:
+                    error, self._task_error = self._task_error, None
+                    raise error
+                # * Always yield to the event loop, even after a late frame
+                await asyncio().sleep(max(0.0, 1 / self._FPS - (time.perf_counter() - start)))
+        finally:
+            self._async = False
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio().gather(*tasks, return_exceptions=True)
+
     def stop(self):
         self._runing = False
+        self.stop_recording()
 
@@ -0,0 +1,189 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+from collections import deque
+import json
+import time
+import pygame
+
+
+# The phases of a frame, in the order they run
+PHASES = [
+    "assets",
+    "draw",
+    "present",
+    "wait",
+    "update",
+    "tick",
+    "after",
+    "frame",
+]
+
+
+class RollingStat:
+    """
+    Keep the last durations of something, to get their percentiles
+
+    :size: int
+    The number of durations kept
+    """
+
+    def __init__(self, size: int = 600):
+        self._samples = deque(maxlen=size)
+        self.count = 0
+
+    def __len__(self):
+        return len(self._samples)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, percent: float, ordered: list | None = None) -> float:
+        """
+        RollingStat.percentile(percent:float)->float
+        The duration under which `percent` % of the kept durations are
+        """
+        if ordered is None:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> dict:
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+            "p50": self.percentile(50, ordered),
+            "p95": self.percentile(95, ordered),
+            "p99": self.percentile(99, ordered),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+
+class FrameProfiler:
+    """
+    This class times the phases of the frames of a Window, and the
+    __draw__ and __feed__ of each widget
+
+    Nothing is measured while `enabled` is False
+
+    :size: int
+    The number of frames kept to compute the percentiles
+    """
+
+    def __init__(self, size: int = 600):
+        self._size = size
+        self.enabled = False
+        self.overlay = False
+        self.frames = 0
+        self._phases = {name: RollingStat(size) for name in PHASES}
+        self._widgets = dict()
+
+    def __repr__(self):
+        return f"""FrameProfiler object ({self.frames} frames, {len(self._widgets)} widgets)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def reset(self):
+        self.frames = 0
+        self._phases = {name: RollingStat(self._size) for name in PHASES}
+        self._widgets.clear()
+
+    def lap(self, phase: str, start: float) -> float:
+        """
+        FrameProfiler.lap(phase:str, start:float)->float
+        Record the time spent in the phase since `start`, and return the current time
+        """
+        now = time.perf_counter()
+        self._phases[phase].add(now - start)
+        return now
+
+    def end_frame(self, start: float):
+        self.lap("frame", start)
+        self.frames += 1
+
+    def time_widget(self, widget, kind: str, function, *args):
+        """
+        FrameProfiler.time_widget(widget, kind:str, function, *args)
+        Call the function and record its duration for the widget,
+        `kind` is "draw" or "feed"
+        """
+        start = time.perf_counter()
+        function(*args)
+        name = widget._key if widget._key is not None else repr(widget)
+        stats = self._widgets.get(name)
+        if stats is None:
+            stats = self._widgets[name] = {
+                "draw": RollingStat(self._size),
+                "feed": RollingStat(self._size),
+            }
+        stats[kind].add(time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        """
+        FrameProfiler.summary()->dict
+        The percentiles of every phase and widget, in seconds
+        """
+        return {
+            "frames": self.frames,
+            "phases": {name: stat.summary() for name, stat in self._phases.items()},
+            "widgets": {
+                str(name): {kind: stat.summary() for kind, stat in stats.items()}
+                for name, stats in self._widgets.items()
+            },
+        }
+
+    def dump_json(self, path: str):
+        """
+        FrameProfiler.dump_json(path:str)
+        Write the summary to a JSON file, to compare builds
+        """
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def __lines__(self, widgets: int = 5) -> list:
+        lines = [f"{self.frames} frames   p50 / p95 / p99 (ms)"]
+        for name, stat in self._phases.items():
+            summary = stat.summary()
+            lines.append(
+                f"{name:<8}{summary['p50'] * 1000:7.2f}{summary['p95'] * 1000:7.2f}{summary['p99'] * 1000:7.2f}"
+            )
+        slowest = sorted(
+            self._widgets.items(),
+            key=lambda item: -(item[1]["draw"].percentile(95) + item[1]["feed"].percentile(95)),
+        )
+        for name, stats in slowest[:widgets]:
+            draw = stats["draw"].percentile(95) * 1000
+            feed = stats["feed"].percentile(95) * 1000
+            lines.append(f"{str(name)[:16]:<16} draw {draw:.2f} feed {feed:.2f}")
+        return lines
+
+    def draw_overlay(self, surf: pygame.surface.Surface, font: pygame.font.Font) -> pygame.Rect:
+        """
+        FrameProfiler.draw_overlay(surf:pygame.Surface, font:pygame.font.Font)->pygame.Rect
+        Draw the statistics on the top right corner of the surface, and return the area used
+        """
+        # ! The numbers change on every frame, they are not put in TEXT_CACHE
+        lines = [font.render(line, True, "#FFFFFF") for line in self.__lines__()]
+        width = max(line.get_width() for line in lines) + 10
+        height = sum(line.get_height() for line in lines) + 10
+        rect = pygame.Rect(surf.get_width() - width, 0, width, height)
+        background = pygame.Surface(rect.size)
+        background.fill("#000000")
+        background.set_alpha(200)
+        surf.blit(background, rect)
+        y = 5
+        for line in lines:
+            surf.blit(line, (rect.x + 5, y))
+            y += line.get_height()
+        return rect
@@ -0,0 +1,107 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+import pygame
+
+
+class SpatialGrid:
+    """
+    A uniform grid used to find the items under a point without testing
+    all of them
+
+    :cell_size: int
+    The size of the cells of the grid, in pixels
+    """
+
+    def __init__(self, cell_size: int = 128):
+        self._cell_size = cell_size
+        self._cells = dict()
+        self._rects = dict()
+
+    def __repr__(self):
+        return f"""SpatialGrid object ({len(self._rects)} items, {len(self._cells)} cells)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, item):
+        return item in self._rects
+
+    def __cells__(self, rect: pygame.Rect):
+        size = self._cell_size
+        for x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (x, y)
+
+    def insert(self, item, rect):
+        """
+        SpatialGrid.insert(item, rect)
+        Add an item covering the given rect
+        """
+        rect = pygame.Rect(rect)
+        if item in self._rects:
+            self.remove(item)
+        self._rects[item] = rect
+        for cell in self.__cells__(rect):
+            self._cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item):
+        """
+        SpatialGrid.remove(item)
+        Remove an item, nothing happens if it is not in the grid
+        """
+        rect = self._rects.pop(item, None)
+        if rect is None:
+            return
+        for cell in self.__cells__(rect):
+            items = self._cells[cell]
+            items.discard(item)
+            if not items:
+                del self._cells[cell]
+
+    def move(self, item, rect):
+        """
+        SpatialGrid.move(item, rect)
+        Update the rect of an item, only touching the grid if it changed
+        """
+        if self._rects.get(item) != rect:
+            self.insert(item, rect)
+
+    def query_point(self, pos) -> list:
+        """
+        SpatialGrid.query_point(pos)->list
+        Return the items whose rect contains the point
+        """
+        x, y = pos
+        cell = (int(x) // self._cell_size, int(y) // self._cell_size)
+        return [
+            item
+            for item in self._cells.get(cell, ())
+            if self._rects[item].collidepoint(x, y)
+        ]
+
+    def query_rect(self, rect) -> set:
+        """
+        SpatialGrid.query_rect(rect)->set
+        Return the items whose rect collides with the given one
+        """
+        rect = pygame.Rect(rect)
+        found = set()
+        for cell in self.__cells__(rect):
+            for item in self._cells.get(cell, ()):
+                if self._rects[item].colliderect(rect):
+                    found.add(item)
+        return found
+
+    def clear(self):
+        self._cells.clear()
+        self._rects.clear()
@@ -0,0 +1,187 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+import heapq
+import itertools
+import time
+
+
+# What a repeating timer does when several of its deadlines were missed
+TIMER_POLICIES = [
+    "coalesce",  # run once, then wait for the next deadline in the future
+    "catchup",  # run once per missed deadline
+]
+
+
+class Timer:
+    """
+    The handle of a callback scheduled by a Scheduler
+
+    :function:
+    The function called when the timer is due
+
+    :delay: float
+    The delay before the call, and between the calls of a repeating timer, in seconds
+
+    :deadline: float
+    The time of the next call, on the clock of the Scheduler
+
+    :repeat: bool
+    True if the timer runs again after each call
+
+    :policy: str
+    What to do with the missed deadlines, see TIMER_POLICIES
+    """
+
+    __slots__ = ("function", "delay", "deadline", "repeat", "policy", "calls", "_scheduler")
+
+    def __init__(self, function, delay, deadline, repeat, policy, scheduler):
+        self.function = function
+        self.delay = delay
+        self.deadline = deadline
+        self.repeat = repeat
+        self.policy = policy
+        self.calls = 0
+        self._scheduler = scheduler
+
+    def __repr__(self):
+        state = "active" if self.active else "stopped"
+        return f"""Timer object ({state}, delay {self.delay}s, repeat {self.repeat})"""
+
+    def __str__(self):
+        return repr(self)
+
+    @property
+    def active(self) -> bool:
+        return self._scheduler is not None
+
+    def cancel(self):
+        """
+        Timer.cancel()
+        Stop the timer, nothing happens if it already stopped
+        """
+        if self._scheduler is not None:
+            self._scheduler.__cancel__(self)
+
+
+class Scheduler:
+    """
+    A min-heap of timers, ordered by deadline
+
+    :clock:
+    The function giving the current time in seconds, time.monotonic by default
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._heap = list()
+        self._counter = itertools.count()
+        self._active = 0
+
+    def __repr__(self):
+        return f"""Scheduler object ({self._active} timers)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def __len__(self):
+        return self._active
+
+    def now(self) -> float:
+        """The current time of the clock of the Scheduler"""
+        return self._clock()
+
+    def schedule(self, function, delay: float, repeat: bool = False, policy: str = "coalesce") -> Timer:
+        """
+        Scheduler.schedule(function, delay:float, repeat:bool=False, policy:str="coalesce")->Timer
+        Call the function after the delay, and then every `delay` seconds if `repeat` is True
+        """
+        if policy not in TIMER_POLICIES:
+            raise ValueError("Unrecognized policy value, see TIMER_POLICIES")
+        if repeat and delay <= 0:
+            raise ValueError("A repeating timer needs a positive delay")
+        timer = Timer(function, delay, self._clock() + delay, repeat, policy, self)
+        self._active += 1
+        self.__push__(timer)
+        return timer
+
+    def __push__(self, timer: Timer):
+        heapq.heappush(self._heap, (timer.deadline, next(self._counter), timer))
+
+    def __cancel__(self, timer: Timer):
+        # * The timer stays in the heap, it is dropped when it reaches the top
+        timer._scheduler = None
+        self._active -= 1
+
+    def next_deadline(self) -> float | None:
+        """
+        Scheduler.next_deadline()->float|None
+        The time of the next call, None if there is no timer
+        """
+        heap = self._heap
+        while heap and heap[0][2]._scheduler is None:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return heap[0][0]
+
+    def time_until_next(self, now: float | None = None) -> float | None:
+        """
+        Scheduler.time_until_next(now:float=None)->float|None
+        The number of seconds before the next call, None if there is no timer
+        `now` replaces the time of the clock when it is given
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        if now is None:
+            now = self._clock()
+        return max(0.0, deadline - now)
+
+    def run_due(self) -> int:
+        """
+        Scheduler.run_due()->int
+        Call all the due timers, in deadline order, and return the number of calls
+        """
+        now = self._clock()
+        heap = self._heap
+        calls = 0
+        while heap and heap[0][0] <= now:
+            deadline, _, timer = heapq.heappop(heap)
+            if timer._scheduler is None:
+                continue
+            if timer.repeat:
+                # * The next deadline is based on the previous one, so the timer never drifts
+                timer.deadline = deadline + timer.delay
+                if timer.policy == "coalesce" and timer.deadline <= now:
+                    missed = int((now - timer.deadline) // timer.delay) + 1
+                    timer.deadline += missed * timer.delay
+                self.__push__(timer)
+            else:
+                self.__cancel__(timer)
+            timer.calls += 1
+            calls += 1
+            timer.function.__call__()
+        return calls
+
+    def rebase(self, offset: float):
+        """
+        Scheduler.rebase(offset:float)
+        Move all the deadlines by `offset` seconds, used when the clock is replaced
+        """
+        # * Moving every deadline by the same offset keeps the heap ordered
+        self._heap = [(deadline + offset, seq, timer) for deadline, seq, timer in self._heap]
+        for _, _, timer in self._heap:
+            timer.deadline += offset
+
+    def clear(self):
+        for _, _, timer in self._heap:
+            timer._scheduler = None
+        self._heap.clear()
+        self._active = 0
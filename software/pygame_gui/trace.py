@@ -0,0 +1,178 @@
+# Comments indications: (by using `better comments` VsCode Extension)
+# * Important
+# TODO
+# ! alert
+# ? queries
+# // deleted code
+
+
+# Imports
+import marshal
+import struct
+import time
+import pygame
+
+
+# The first bytes of a trace file, followed by the version
+MAGIC = b"PGTR"
+VERSION = 1
+# A frame: timestamp, pointer x, pointer y, number of events
+FRAME = struct.Struct("<dhhH")
+# An event: type, length of the marshalled attributes
+EVENT = struct.Struct("<IH")
+
+
+def encode_event(event: pygame.event.Event) -> bytes:
+    """
+    encode_event(event:pygame.event.Event)->bytes
+    Serialize an event, the attributes that can not be marshalled are dropped
+    """
+    attributes = dict()
+    for key, value in event.dict.items():
+        try:
+            marshal.dumps(value)
+        except ValueError:
+            continue
+        attributes[key] = value
+    payload = marshal.dumps(attributes)
+    return EVENT.pack(event.type, len(payload)) + payload
+
+
+class VirtualClock:
+    """
+    A clock only moving when it is set, used to replay a trace
+    """
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TraceRecorder:
+    """
+    This class writes the events read by a Window into a binary file,
+    one record per frame, with the time of the frame and the pointer position
+
+    :path: str
+    The path of the trace file
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + bytes((VERSION,)))
+        self.frames = 0
+        self.events = 0
+
+    def __repr__(self):
+        return f"""TraceRecorder object ({self._path}, {self.frames} frames)"""
+
+    def __str__(self):
+        return repr(self)
+
+    def record(self, timestamp: float, pointer: tuple, events: list):
+        """
+        TraceRecorder.record(timestamp:float, pointer:tuple, events:list)
+        Write the events of a frame, `timestamp` is Window.duration
+        """
+        self._file.write(FRAME.pack(timestamp, int(pointer[0]), int(pointer[1]), len(events)))
+        for event in events:
+            self._file.write(encode_event(event))
+        self.frames += 1
+        self.events += len(events)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_trace(path: str):
+    """
+    read_trace(path:str)
+    Yield the (timestamp, pointer, events) of each frame of a trace file
+    """
+    with open(path, "rb") as file:
+        header = file.read(len(MAGIC) + 1)
+        if header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a trace file")
+        if header[len(MAGIC)] != VERSION:
+            raise ValueError(f"Unsupported trace version {header[len(MAGIC)]}")
+        while True:
+            data = file.read(FRAME.size)
+            if len(data) < FRAME.size:
+                return
+            timestamp, x, y, count = FRAME.unpack(data)
+            events = list()
+            for _ in range(count):
+                type_, length = EVENT.unpack(file.read(EVENT.size))
+                attributes = marshal.loads(file.read(length))
+                events.append(pygame.event.Event(type_, attributes))
+            yield timestamp, (x, y), events
+
+
+class TraceReplayer:
+    """
+    This class feeds a Window with the frames of a trace file
+
+    The clock of the Window is replaced by the recorded one while replaying,
+    so Window.duration, the `tick` callbacks and the `after` timers see
+    the same times as during the recording. Replay on a Window built like
+    the recorded one, so its timers are scheduled at the same times
+
+    :path: str
+    The path of the trace file
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def __repr__(self):
+        return f"""TraceReplayer object ({self._path})"""
+
+    def __str__(self):
+        return repr(self)
+
+    def replay(self, window, speed: float | None = None) -> dict:
+        """
+        TraceReplayer.replay(window, speed:float=None)->dict
+
+        Run a frame of the window for each recorded frame
+        `speed` is 1 for the recorded speed, 2 for twice faster...,
+        None to replay as fast as possible
+        A QUIT event ends the replay instead of closing the program
+        Return the number of frames and events replayed, and the time it took
+        """
+        clock = VirtualClock(window.duration)
+        real_time = window._time
+        # * Window.frame() reads the time once, after the events, like when recording
+        window._time = lambda: clock.now + window._begin
+        frames = 0
+        replayed = 0
+        start = time.perf_counter()
+        first = None
+        try:
+            for timestamp, pointer, events in read_trace(self._path):
+                if first is None:
+                    first = timestamp
+                if any(event.type == pygame.QUIT for event in events):
+                    break
+                if speed is not None:
+                    delay = (timestamp - first) / speed - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+                clock.now = timestamp
+                window.frame(events=events, pointer=pointer)
+                frames += 1
+                replayed += len(events)
+        finally:
+            now = real_time()
+            window.timers.rebase(now - window._now)
+            window._now = now
+            window._time = real_time
+        return {
+            "frames": frames,
+            "events": replayed,
+            "seconds": time.perf_counter() - start,
+        }